@@ -2,8 +2,10 @@
 # ABOUTME: Handles unified input processing (URLs, files, directories) with intelligent organization
 # SPDX-License-Identifier: MIT
 
+import functools
 import os
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -23,16 +25,60 @@ def _determine_download_directory(directory: str | None) -> Path:
 
     Note: Does not create directories, just determines the path.
     """
+    return _resolve_download_directory(
+        directory, os.environ.get("PAPERS_DIR"), str(Path.home())
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_download_directory(
+    directory: str | None, papers_dir: str | None, home: str
+) -> Path:
+    """Resolve the download directory from its inputs.
+
+    Cached on every input it depends on, so a changed PAPERS_DIR or home
+    directory produces a fresh result rather than a stale one.
+    """
     if directory is not None:
         # 1. Command line --dir flag (highest priority)
         return Path(directory).expanduser()
 
-    if papers_dir := os.environ.get("PAPERS_DIR"):
+    if papers_dir:
         # 2. PAPERS_DIR environment variable
         return Path(papers_dir).expanduser()
 
     # 3. Default: ~/Papers (will be created by _setup_download_directory)
-    return Path.home() / "Papers"
+    return Path(home) / "Papers"
+
+
+def _create_directory(path: Path) -> bool:
+    """Create path (and parents) if missing.
+
+    Attempts the mkdir directly instead of checking existence first, so a new
+    directory costs a single syscall.
+
+    Returns:
+        True if the directory was created, False if it already existed
+    """
+    try:
+        path.mkdir(parents=True)
+    except FileExistsError:
+        if not path.is_dir():
+            raise
+        return False
+    return True
+
+
+def _directory_error(directory: Path, error: OSError) -> FileSystemError:
+    """Build the error reported when a download directory cannot be created."""
+    return FileSystemError(
+        f"Cannot create directory '{directory}'",
+        details={
+            "directory": str(directory),
+            "error": str(error),
+            "suggestion": "Set PAPERS_DIR or use --dir to specify a writable location",
+        },
+    )
 
 
 def _setup_download_directory(
@@ -43,61 +89,29 @@ def _setup_download_directory(
     Returns:
         Tuple of (directory_path, is_first_run_papers_dir)
     """
-    # Check first-run condition BEFORE calling _determine_download_directory
-    papers_dir = Path.home() / "Papers"
-    is_first_run = (
-        directory is None
-        and os.environ.get("PAPERS_DIR") is None
-        and not papers_dir.exists()
-    )
-
-    # Now determine directory (but not create yet)
+    uses_papers_default = directory is None and os.environ.get("PAPERS_DIR") is None
     download_dir = _determine_download_directory(directory)
 
-    # Create directory with fallback logic
+    # Create directory with fallback logic; first run means we created ~/Papers
     try:
-        download_dir.mkdir(parents=True, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        # If we were trying to create ~/Papers and failed, fallback to current directory
-        if (
-            download_dir == papers_dir
-            and directory is None
-            and os.environ.get("PAPERS_DIR") is None
-        ):
-            download_dir = Path.cwd()
-            is_first_run = False  # Not first run if we fallback
-            try:
-                download_dir.mkdir(parents=True, exist_ok=True)
-            except (OSError, PermissionError) as fallback_e:
-                suggested_fix = (
-                    "Set PAPERS_DIR or use --dir to specify a writable location"
-                )
-                error_message = f"Cannot create directory '{download_dir}'"
-                raise FileSystemError(
-                    error_message,
-                    details={
-                        "directory": str(download_dir),
-                        "error": str(fallback_e),
-                        "suggestion": suggested_fix,
-                    },
-                ) from fallback_e
-        else:
+        is_first_run = _create_directory(download_dir) and uses_papers_default
+    except OSError as e:
+        if not uses_papers_default:
             # For custom directories, fail with helpful message
-            suggested_fix = "Set PAPERS_DIR or use --dir to specify a writable location"
-            error_message = f"Cannot create directory '{download_dir}'"
-            raise FileSystemError(
-                error_message,
-                details={
-                    "directory": str(download_dir),
-                    "error": str(e),
-                    "suggestion": suggested_fix,
-                },
-            ) from e
+            raise _directory_error(download_dir, e) from e
+
+        # If we were trying to create ~/Papers and failed, fallback to current directory
+        download_dir = Path.cwd()
+        is_first_run = False  # Not first run if we fallback
+        try:
+            download_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as fallback_e:
+            raise _directory_error(download_dir, fallback_e) from fallback_e
 
     # Show first-run message for ~/Papers creation
     if is_first_run and not quiet:
         click.echo(
-            f"📁 Created {papers_dir} directory for your organized papers", err=True
+            f"📁 Created {download_dir} directory for your organized papers", err=True
         )
         click.echo(
             "   Use --dir to specify a different location, or set PAPERS_DIR", err=True
@@ -119,7 +133,26 @@ def _handle_error(e: Exception, *, quiet: bool) -> None:  # noqa: ARG001
     raise click.Abort from e
 
 
-@click.command()
+class _CachedHelpCommand(click.Command):
+    """Click command that formats its help text once and reuses it.
+
+    The options are fixed at import time, so help output only varies with the
+    command path and the formatter width.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._help_cache: dict[tuple[str, int], str] = {}
+
+    def get_help(self, ctx: click.Context) -> str:
+        """Return the formatted help text, rendering it on first use."""
+        key = (ctx.command_path, ctx.make_formatter().width)
+        if key not in self._help_cache:
+            self._help_cache[key] = super().get_help(ctx)
+        return self._help_cache[key]
+
+
+@click.command(cls=_CachedHelpCommand)
 @click.argument("input_arg", metavar="INPUT")
 @click.option(
     "--dir",
@@ -3,46 +3,235 @@
 # SPDX-License-Identifier: MIT
 
 import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import random
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.exceptions import SSLError as Urllib3SSLError
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
 
 from .exceptions import FileSystemError, HTTPError, NetworkError, ValidationError
 
+if TYPE_CHECKING:
+    from urllib3.response import BaseHTTPResponse
+
 # Retry configuration constants
 MAX_NETWORK_RETRIES = 3  # Network timeouts and connection errors
 INITIAL_RETRY_DELAY = 1.0  # Initial delay in seconds
 BACKOFF_MULTIPLIER = 2.0  # Exponential backoff multiplier
+MAX_RETRY_DELAY = 60.0  # Upper bound on any single retry delay in seconds
+
+# Transient requests failures that with_retry retries
+_RETRYABLE_REQUEST_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+
+# Overload/gateway statuses retried by the session's urllib3 Retry policy,
+# honouring Retry-After up to MAX_RETRY_DELAY
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+STATUS_RETRIES = 3
+STATUS_RETRY_BACKOFF = 0.5  # urllib3 backoff_factor, in seconds
+
+# Client errors that will not change on retry (408/429 are deliberately absent)
+NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404, 410})
+
+# Bytes requested per body read step; small chunks make per-chunk Python
+# overhead dominate the socket read loop
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Largest Content-Length trusted for preallocation and size checks; bigger
+# values are treated as malformed
+MAX_CONTENT_LENGTH = 10 * 1024**3
+
+# Bytes per read when nothing observes individual chunks (no progress or
+# head-ready callback), so the copy loop runs once per megabyte
+BULK_CHUNK_SIZE = 1024 * 1024
+
+# Status and Content-Range format of a resumed (range) response
+HTTP_PARTIAL_CONTENT = 206
+
+# Status of a Range starting at or past the end of the file; its
+# Content-Range ("bytes */<total>") carries the full size
+HTTP_RANGE_NOT_SATISFIABLE = 416
+
+# Status of a conditional request whose cached copy is still current
+HTTP_NOT_MODIFIED = 304
+
+# Suffix of the sidecar file holding a download's ETag/Last-Modified
+VALIDATORS_SUFFIX = ".etag"
+
+# Suffix of the file a download is written to until it is complete
+PARTIAL_SUFFIX = ".part"
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-\d+/(\d+|\*)", re.IGNORECASE)
+_UNSATISFIED_RANGE_RE = re.compile(r"bytes\s+\*/(\d+)", re.IGNORECASE)
+
+# Content-Disposition filename forms, tried in order of preference
+_FILENAME_PATTERNS = (
+    re.compile(r'filename\*?=\s*"([^"]+)"', re.IGNORECASE),  # filename="file.pdf"
+    re.compile(r"filename\*?=\s*'([^']+)'", re.IGNORECASE),  # filename='file.pdf'
+    re.compile(r"filename\*?=\s*([^;,\s]+)", re.IGNORECASE),  # filename=file.pdf
+)
+
+# Minimum seconds between progress callbacks (at most 20 updates per second)
+PROGRESS_MIN_INTERVAL = 0.05
+
+logger = logging.getLogger(__name__)
+
+# Concurrent downloads in download_files, overridable via PAPERS_DOWNLOAD_WORKERS
+DEFAULT_DOWNLOAD_WORKERS = 16
+
+# Bytes a batch worker accumulates before publishing to the shared total
+AGGREGATE_FLUSH_BYTES = 1024 * 1024
+
+# Connection pool sizing for the shared session: number of hosts kept and
+# connections kept per host
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Compressed transfer encodings requests can decode transparently
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Files that are already compressed; gzip on the wire would not shrink them
+# and only costs a decompression pass, so identity encoding is requested
+PRECOMPRESSED_SUFFIXES = frozenset({".pdf", ".gz", ".zip", ".xz", ".bz2"})
+
+
+class _CappedRetry(Retry):
+    """Retry policy that never waits longer than MAX_RETRY_DELAY on Retry-After.
+
+    urllib3 2.x caps the hint at six hours and 1.26 does not cap it at all,
+    so one throttled response could otherwise stall a download for hours.
+    """
+
+    def get_retry_after(self, response: "BaseHTTPResponse") -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_DELAY)
+
+
+def _status_retry() -> Retry:
+    """Retry policy for overloaded servers, applied inside the connection pool.
+
+    Only status retries are enabled; connection failures and timeouts are
+    retried by with_retry, so the two layers do not multiply attempts. The
+    final response is returned rather than raised, leaving HTTPError
+    mapping to raise_for_status.
+    """
+    return _CappedRetry(
+        total=None,
+        connect=0,
+        read=0,
+        status=STATUS_RETRIES,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        backoff_factor=STATUS_RETRY_BACKOFF,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _create_session() -> requests.Session:
+    """Create a session with pooled keep-alive connections for both schemes."""
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_status_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across requests so repeated downloads from one host (arxiv.org, ...)
+# reuse TCP/TLS connections instead of handshaking every time
+_SESSION = _create_session()
+
+
+def close_session() -> None:
+    """Close pooled connections held by the shared download session."""
+    _SESSION.close()
 
 
 def calculate_retry_delay(
     attempt: int,
     initial_delay: float = INITIAL_RETRY_DELAY,
     multiplier: float = BACKOFF_MULTIPLIER,
+    *,
+    jitter: bool = True,
+    max_delay: float = MAX_RETRY_DELAY,
 ) -> float:
     """Calculate exponential backoff delay for retry attempts.
 
+    With jitter ("full jitter") the delay is drawn uniformly from
+    [0, min(base, max_delay)], so parallel downloads failing together against
+    one host spread their retries over the whole window instead of retrying
+    in lockstep.
+
     Args:
         attempt: Current retry attempt number (0-based)
         initial_delay: Base delay in seconds
         multiplier: Exponential growth factor
+        jitter: Randomize the delay instead of using the exact backoff value
+        max_delay: Upper bound on the returned delay
 
     Returns:
         Calculated delay in seconds for this attempt
 
     Examples:
-        >>> calculate_retry_delay(0)  # First retry
+        >>> calculate_retry_delay(0, jitter=False)  # First retry
         1.0
-        >>> calculate_retry_delay(1)  # Second retry
+        >>> calculate_retry_delay(1, jitter=False)  # Second retry
         2.0
-        >>> calculate_retry_delay(2)  # Third retry
+        >>> calculate_retry_delay(2, jitter=False)  # Third retry
         4.0
     """
-    return initial_delay * (multiplier**attempt)
+    try:
+        backoff = initial_delay * (multiplier**attempt)
+    except OverflowError:
+        # Long retry chains outgrow float range long after reaching max_delay
+        backoff = max_delay
+    ceiling = min(backoff, max_delay)
+    if jitter:
+        return random.uniform(0, ceiling)
+    return ceiling
+
+
+def _is_non_retryable_status(error: Exception) -> bool:
+    """Check whether an exception carries a client error status worth no retry."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code in NON_RETRYABLE_STATUS_CODES
 
 
 # Type variable for generic retry function
@@ -55,6 +244,9 @@ def with_retry(
     retryable_exceptions: tuple[type[Exception], ...],
     initial_delay: float = INITIAL_RETRY_DELAY,
     multiplier: float = BACKOFF_MULTIPLIER,
+    *,
+    jitter: bool = True,
+    max_delay: float = MAX_RETRY_DELAY,
 ) -> T:
     """Execute function with exponential backoff retry logic.
 
@@ -64,13 +256,16 @@ def with_retry(
         retryable_exceptions: Exception types that trigger retries
         initial_delay: Base delay in seconds for first retry
         multiplier: Exponential backoff multiplier
+        jitter: Randomize delays (see calculate_retry_delay)
+        max_delay: Upper bound on any single delay in seconds
 
     Returns:
         Result of successful function execution
 
     Raises:
         The final exception if all retries are exhausted
-        Any non-retryable exception immediately
+        Any non-retryable exception immediately, including retryable types
+        that carry a status in NON_RETRYABLE_STATUS_CODES
 
     Examples:
         >>> def failing_request():
@@ -85,18 +280,32 @@ def with_retry(
     """
     last_exception = None
 
+    # Resolve loop invariants once; time.sleep is looked up per call so tests
+    # that patch it still take effect
+    retryable = tuple(retryable_exceptions)
+    sleep = time.sleep
+    delay_for = calculate_retry_delay
+    is_permanent = _is_non_retryable_status
+
     for attempt in range(max_retries + 1):
         try:
             return func()
-        except retryable_exceptions as e:  # noqa: PERF203
+        except retryable as e:  # noqa: PERF203
+            if is_permanent(e):
+                raise
             last_exception = e
             if attempt < max_retries:
-                delay = calculate_retry_delay(attempt, initial_delay, multiplier)
-                time.sleep(delay)
+                sleep(
+                    delay_for(
+                        attempt,
+                        initial_delay,
+                        multiplier,
+                        jitter=jitter,
+                        max_delay=max_delay,
+                    )
+                )
             # If this was the last attempt, we'll raise below
-        except Exception:
-            # Non-retryable exception - raise immediately
-            raise
+        # Any other exception is not retryable and propagates immediately
 
     # All retries exhausted - raise the last exception
     if last_exception is not None:
@@ -175,7 +384,7 @@ def _fetch_response(url: str) -> requests.Response:
         HTTPError: If HTTP response indicates an error
     """
     try:
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
     except requests.exceptions.Timeout as e:
         msg = "Request timed out after 30 seconds"
         raise NetworkError(msg, details={"url": url}) from e
@@ -195,6 +404,11 @@ def _fetch_response(url: str) -> requests.Response:
     return response
 
 
+def _is_precompressed_url(url: str) -> bool:
+    """Check whether a URL names a file type that is already compressed."""
+    return Path(urlparse(url).path).suffix.lower() in PRECOMPRESSED_SUFFIXES
+
+
 def _is_pdf_content_type(response: requests.Response) -> bool:
     """Check if response Content-Type indicates a PDF.
 
@@ -231,16 +445,9 @@ def _extract_filename_from_content_disposition(
     if not content_disposition:
         return None
 
-    # Look for filename= or filename*= patterns
-    # Handle both quoted and unquoted filenames
-    patterns = [
-        r'filename\*?=\s*"([^"]+)"',  # filename="file.pdf" or filename*="file.pdf"
-        r"filename\*?=\s*'([^']+)'",  # filename='file.pdf'
-        r"filename\*?=\s*([^;,\s]+)",  # filename=file.pdf (unquoted)
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content_disposition, re.IGNORECASE)
+    # Look for filename= or filename*= patterns, quoted forms first
+    for pattern in _FILENAME_PATTERNS:
+        match = pattern.search(content_disposition)
         if match:
             filename = match.group(1).strip()
             # Handle RFC 5987 encoded filenames (UTF-8'en'filename)
@@ -252,6 +459,30 @@ def _extract_filename_from_content_disposition(
     return None
 
 
+def _content_length_from_headers(headers: Mapping[str, str]) -> int:
+    """Parse a usable Content-Length out of response headers.
+
+    A compressed body's Content-Length counts encoded bytes, while the body
+    is read decoded, so it is treated as unknown. So are values that are not
+    plain non-negative integers or exceed MAX_CONTENT_LENGTH.
+
+    Args:
+        headers: Case-insensitive response headers
+
+    Returns:
+        Content length in bytes, or -1 if unknown
+    """
+    encoding = headers.get("content-encoding", "identity")
+    if encoding.strip().lower() != "identity":
+        return -1
+    value = headers.get("content-length", "").strip()
+    # isdigit alone also accepts non-ASCII digits such as superscripts
+    if not (value.isascii() and value.isdigit()):
+        return -1
+    length = int(value)
+    return length if length <= MAX_CONTENT_LENGTH else -1
+
+
 def _get_content_length(response: requests.Response) -> int:
     """Extract content length from response headers.
 
@@ -261,77 +492,402 @@ def _get_content_length(response: requests.Response) -> int:
     Returns:
         Content length in bytes, or -1 if unknown
     """
-    if "content-length" in response.headers:
+    return _content_length_from_headers(response.headers)
+
+
+def _existing_size(dest_path: Path) -> int:
+    """Return the size of a partially downloaded file, or 0 if there is none."""
+    try:
+        return dest_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _resolve_resume(response: requests.Response, offset: int) -> tuple[int, int]:
+    """Work out where the response body starts and the full file size.
+
+    Args:
+        response: HTTP response to a request that may have carried a Range
+        offset: Byte offset that was requested (0 for a full download)
+
+    Returns:
+        Tuple of (start_offset, total_bytes). start_offset is 0 when the server
+        sent the whole file; total_bytes is -1 if unknown.
+
+    Raises:
+        ValidationError: If a partial response does not start at offset
+    """
+    content_length = _get_content_length(response)
+    if not offset or response.status_code != HTTP_PARTIAL_CONTENT:
+        # Server ignored the Range header and sent the full file
+        return 0, content_length
+
+    match = _CONTENT_RANGE_RE.match(response.headers.get("content-range", ""))
+    if not match or int(match.group(1)) != offset:
+        msg = "Server returned a partial response for an unexpected range"
+        raise ValidationError(
+            msg,
+            details={
+                "requested_offset": offset,
+                "content_range": response.headers.get("content-range"),
+            },
+        )
+
+    if match.group(2) != "*":
+        return offset, int(match.group(2))
+    if content_length >= 0:
+        return offset, offset + content_length
+    return offset, -1
+
+
+def _fetch_resumable(
+    url: str, headers: dict[str, str], part_path: Path, offset: int
+) -> tuple[Optional[requests.Response], int]:
+    """Fetch url, recovering when a resumed Range is not satisfiable.
+
+    A server answers 416 when the partial file already holds every byte. If
+    its Content-Range confirms that size, nothing is left to fetch; otherwise
+    the partial file does not match the server's copy, so it is discarded
+    and the whole file requested again.
+
+    Args:
+        url: Source URL to download from
+        headers: Request headers; a Range is added when offset is non-zero
+        part_path: Partial file the Range continues
+        offset: Byte offset to resume from (0 for a full download)
+
+    Returns:
+        Tuple of (response, offset). response is None when the partial file
+        is already complete; offset drops to 0 when the download restarts.
+
+    Raises:
+        NetworkError: If network request fails after all retries
+        HTTPError: If HTTP response indicates an error (no retry)
+    """
+    if not offset:
+        return _fetch_response_with_retry(url, headers), 0
+
+    ranged_headers = {**headers, "Range": f"bytes={offset}-"}
+    response = _fetch_response_with_retry(url, ranged_headers)
+    if response.status_code != HTTP_RANGE_NOT_SATISFIABLE:
+        return response, offset
+
+    response.close()
+    match = _UNSATISFIED_RANGE_RE.match(response.headers.get("content-range", ""))
+    if match and int(match.group(1)) == offset:
+        return None, offset
+
+    logger.info("Partial download of %s does not match the server, restarting", url)
+    _remove_partial_file(part_path)
+    return _fetch_response_with_retry(url, headers), 0
+
+
+def partial_download_path(destination_path: Union[str, Path]) -> Path:
+    """Return the file a download of destination_path is written to.
+
+    Downloads only appear at destination_path once complete; until then the
+    body goes to this sibling file, which is also what resume continues.
+
+    Args:
+        destination_path: Final path of the download
+
+    Returns:
+        destination_path with PARTIAL_SUFFIX appended to its name
+    """
+    dest_path = Path(destination_path)
+    return dest_path.with_name(dest_path.name + PARTIAL_SUFFIX)
+
+
+def _finish_partial(
+    part_path: Path, dest_path: Path, content_buffer: Optional[BinaryIO] = None
+) -> None:
+    """Atomically move a complete download into place.
+
+    Args:
+        part_path: Complete partial file
+        dest_path: Final destination
+        content_buffer: Optional sink that receives the whole file first
+
+    Raises:
+        FileSystemError: If the file cannot be renamed
+    """
+    try:
+        if content_buffer is not None:
+            content_buffer.write(part_path.read_bytes())
+        part_path.replace(dest_path)
+    except OSError as e:
+        _remove_partial_file(part_path)
+        msg = f"Cannot move completed download into place: {e}"
+        raise FileSystemError(msg, path=str(dest_path)) from e
+
+
+def _remove_partial_file(dest_path: Path) -> None:
+    """Remove an incomplete download, ignoring errors."""
+    if dest_path.exists():
+        with contextlib.suppress(OSError):
+            dest_path.unlink()
+
+
+def _validators_path(dest_path: Path) -> Path:
+    """Return the sidecar path storing cache validators for a download."""
+    return dest_path.with_name(dest_path.name + VALIDATORS_SUFFIX)
+
+
+def _conditional_headers(dest_path: Path) -> dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers for an existing download.
+
+    Args:
+        dest_path: Previously downloaded file
+
+    Returns:
+        Conditional request headers, or an empty dict when the file or its
+        validators sidecar is missing or unreadable
+    """
+    if not dest_path.exists():
+        return {}
+    try:
+        validators = json.loads(_validators_path(dest_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(validators, dict):
+        return {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = str(validators["etag"])
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = str(validators["last_modified"])
+    return headers
+
+
+def _save_validators(dest_path: Path, response: requests.Response) -> None:
+    """Store the response's ETag/Last-Modified next to a finished download.
+
+    Failing to write the sidecar only costs a full download next time, so
+    errors are ignored.
+    """
+    validators = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+    sidecar = _validators_path(dest_path)
+    with contextlib.suppress(OSError):
+        if any(validators.values()):
+            sidecar.write_text(json.dumps(validators))
+        else:
+            sidecar.unlink(missing_ok=True)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor, handling short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _preallocate(fd: int, size: int) -> int:
+    """Reserve size bytes for a new download so the file is laid out contiguously.
+
+    Returns:
+        Number of bytes reserved; 0 where the size is unknown or posix_fallocate
+        is unavailable or unsupported by the filesystem
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return 0
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        return 0
+    return size
+
+
+def _trim_preallocation(fd: int, written: int, reserved: int) -> None:
+    """Drop reserved space the body never filled.
+
+    Keeps the file size equal to the bytes actually written, which resume
+    relies on to pick its Range offset.
+    """
+    if written < reserved:
+        os.ftruncate(fd, written)
+
+
+class _RateLimitedProgress:
+    """Forward progress updates to a callback at most once per interval.
+
+    The update that completes a known-size download always goes through, and
+    flush() delivers any update that was held back. Errors raised by the
+    callback are logged and never interrupt the download. A None callback
+    makes every update a no-op.
+    """
+
+    def __init__(
+        self, callback: Optional[Callable[[int, int], None]], min_interval: float
+    ) -> None:
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_time = time.monotonic()
+        self._pending: Optional[tuple[int, int]] = None
+
+    def __call__(self, bytes_downloaded: int, total_bytes: int) -> None:
+        if self._callback is None:
+            return
+        now = time.monotonic()
+        if (
+            bytes_downloaded == total_bytes
+            or now - self._last_time >= self._min_interval
+        ):
+            self._emit(bytes_downloaded, total_bytes, now)
+        else:
+            self._pending = (bytes_downloaded, total_bytes)
+
+    def flush(self) -> None:
+        """Deliver the most recent update if it has not been reported yet."""
+        if self._pending is not None:
+            self._emit(*self._pending, time.monotonic())
+
+    def _emit(self, bytes_downloaded: int, total_bytes: int, now: float) -> None:
+        self._pending = None
+        self._last_time = now
+        if self._callback is None:
+            return
         try:
-            return int(response.headers["content-length"])
-        except (ValueError, TypeError):
-            pass
-    return -1
+            self._callback(bytes_downloaded, total_bytes)
+        except Exception:
+            logger.debug("Progress callback failed", exc_info=True)
 
 
 def _write_content_to_file(
-    response: requests.Response,
+    chunks: Iterable[bytes],
     dest_path: Path,
     progress_callback: Optional[Callable[[int, int], None]],
     total_bytes: int,
+    *,
+    content_buffer: Optional[BinaryIO] = None,
+    start_offset: int = 0,
+    keep_partial: bool = False,
+    progress_min_interval: float = PROGRESS_MIN_INTERVAL,
 ) -> int:
     """Write response content to file with progress tracking.
 
     Args:
-        response: HTTP response object
+        chunks: Response body chunks, e.g. from _iter_body
         dest_path: Destination file path
         progress_callback: Optional progress callback
         total_bytes: Total content length (-1 if unknown)
+        content_buffer: Optional in-memory sink that receives a copy of
+                        every chunk written to disk
+        start_offset: Bytes already on disk; when non-zero the response is
+                      appended to the existing file instead of replacing it
+        keep_partial: Leave the partial file in place on errors so a later
+                      download can resume it
+        progress_min_interval: Minimum seconds between progress callbacks
 
     Returns:
-        Number of bytes successfully downloaded
+        Size of the file in bytes, including start_offset
 
     Raises:
         FileSystemError: If file operations fail
     """
-    bytes_downloaded = 0
+    bytes_downloaded = start_offset
+    progress = _RateLimitedProgress(progress_callback, progress_min_interval)
+    flags = (
+        os.O_WRONLY
+        | os.O_CREAT
+        | (os.O_APPEND if start_offset else os.O_TRUNC)
+        | getattr(os, "O_BINARY", 0)
+    )
     try:
-        with dest_path.open("wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:  # filter out keep-alive chunks
-                    try:
-                        f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                    except OSError as e:
-                        msg = f"Failed to write to file: {e}"
-                        raise FileSystemError(msg, path=str(dest_path)) from e
-
-                    # Call progress callback if provided
-                    if progress_callback:
-                        with contextlib.suppress(Exception):
-                            progress_callback(bytes_downloaded, total_bytes)
+        fd = os.open(dest_path, flags, 0o666)
+        # Appends to a partial file must not be padded past its current end
+        reserved = 0 if start_offset else _preallocate(fd, total_bytes)
+        try:
+            # Empty chunks are keep-alives
+            for chunk in filter(None, chunks):
+                try:
+                    _write_all(fd, chunk)
+                    bytes_downloaded += len(chunk)
+                    if content_buffer is not None:
+                        content_buffer.write(chunk)
+                except OSError as e:
+                    msg = f"Failed to write to file: {e}"
+                    raise FileSystemError(msg, path=str(dest_path)) from e
+
+                progress(bytes_downloaded, total_bytes)
+        finally:
+            # A failed trim must not leak the descriptor
+            try:
+                _trim_preallocation(fd, bytes_downloaded, reserved)
+            finally:
+                os.close(fd)
+        progress.flush()
+
+    except requests.exceptions.RequestException:
+        # Reading the body failed; these subclass OSError but are not local
+        if not keep_partial:
+            _remove_partial_file(dest_path)
+        raise
 
     except OSError as e:
         # Clean up partial file on any file system error
-        if dest_path.exists():
-            with contextlib.suppress(OSError):
-                dest_path.unlink()
+        _remove_partial_file(dest_path)
         msg = f"File operation failed: {e}"
         raise FileSystemError(msg, path=str(dest_path)) from e
 
     except Exception:
-        # Clean up partial file on any other error
-        if dest_path.exists():
-            with contextlib.suppress(OSError):
-                dest_path.unlink()
+        # Clean up partial file on any other error, unless it will be resumed
+        if not keep_partial:
+            _remove_partial_file(dest_path)
         raise
 
     return bytes_downloaded
 
 
-def _fetch_response_with_retry(url: str) -> requests.Response:
+def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+    """Yield the decoded response body straight from the urllib3 stream.
+
+    iter_content wraps the same stream in extra generator layers whose
+    per-chunk cost shows up on fast links. urllib3 errors are translated to
+    the requests exceptions iter_content would raise. Responses without a
+    urllib3 body (other adapters, test doubles) fall back to iter_content.
+
+    Args:
+        response: Streamed response whose body has not been read
+        chunk_size: Bytes requested per read
+
+    Yields:
+        Body chunks, decompressed per Content-Encoding
+    """
+    raw = response.raw
+    if not isinstance(raw, HTTPResponse):
+        yield from response.iter_content(chunk_size=chunk_size)
+        return
+
+    try:
+        yield from raw.stream(chunk_size, decode_content=True)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    except Urllib3SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+
+
+def _fetch_response_with_retry(
+    url: str, headers: Optional[dict[str, str]] = None
+) -> requests.Response:
     """Fetch HTTP response with retry logic for network failures.
 
     Args:
         url: Source URL to download from
+        headers: Optional extra request headers (e.g. Range)
 
     Returns:
-        HTTP response object
+        HTTP response object with the body left unread (streamed); callers
+        must close it. A 416 answer to a Range request is returned rather
+        than raised, so the caller can tell a finished partial file apart
 
     Raises:
         NetworkError: If network request fails after all retries
@@ -339,23 +895,19 @@ def _fetch_response_with_retry(url: str) -> requests.Response:
     """
 
     def make_request() -> requests.Response:
-        return requests.get(url, timeout=30)
+        if headers:
+            return _SESSION.get(url, timeout=30, stream=True, headers=headers)
+        return _SESSION.get(url, timeout=30, stream=True)
 
     try:
         response = with_retry(
             make_request,
             max_retries=MAX_NETWORK_RETRIES,
-            retryable_exceptions=(
-                requests.exceptions.Timeout,
-                requests.exceptions.ConnectionError,
-            ),
+            retryable_exceptions=_RETRYABLE_REQUEST_ERRORS,
             initial_delay=INITIAL_RETRY_DELAY,
             multiplier=BACKOFF_MULTIPLIER,
         )
-    except (
-        requests.exceptions.Timeout,
-        requests.exceptions.ConnectionError,
-    ) as e:
+    except _RETRYABLE_REQUEST_ERRORS as e:
         # Convert to domain exception
         if isinstance(e, requests.exceptions.Timeout):
             msg = "Request timed out after 30 seconds"
@@ -366,6 +918,13 @@ def _fetch_response_with_retry(url: str) -> requests.Response:
         msg = f"Request failed: {e}"
         raise NetworkError(msg, details={"url": url}) from e
 
+    if (
+        response.status_code == HTTP_RANGE_NOT_SATISFIABLE
+        and headers
+        and "Range" in headers
+    ):
+        return response
+
     # Handle HTTP status errors (no retry)
     try:
         response.raise_for_status()
@@ -409,7 +968,7 @@ def get_download_info(url: str) -> tuple[Optional[str], bool]:
 
     # Make HEAD request to get headers
     try:
-        response = requests.head(url, timeout=30, allow_redirects=True)
+        response = _SESSION.head(url, timeout=30, allow_redirects=True)
     except requests.exceptions.Timeout as e:
         msg = "Request timed out after 30 seconds"
         raise NetworkError(msg, details={"url": url}) from e
@@ -434,19 +993,130 @@ def get_download_info(url: str) -> tuple[Optional[str], bool]:
     return suggested_filename, is_pdf_content
 
 
+def _check_complete(
+    dest_path: Path, bytes_downloaded: int, total_bytes: int, *, keep_partial: bool
+) -> None:
+    """Verify a finished download against its expected size.
+
+    Args:
+        dest_path: Downloaded file
+        bytes_downloaded: Bytes on disk after the transfer
+        total_bytes: Expected size (-1 if unknown, which skips the check)
+        keep_partial: Leave an incomplete file in place for a later resume
+
+    Raises:
+        ValidationError: If the size is known and does not match
+    """
+    if total_bytes > 0 and bytes_downloaded != total_bytes:
+        # Clean up incomplete file
+        if not keep_partial:
+            _remove_partial_file(dest_path)
+        msg = f"Download incomplete: expected {total_bytes} bytes, got {bytes_downloaded} bytes"
+        raise ValidationError(
+            msg,
+            details={"expected_bytes": total_bytes, "actual_bytes": bytes_downloaded},
+        )
+
+
+def verify_sha256(path: Union[str, Path], expected: str) -> bool:
+    """Check a downloaded file against an expected SHA-256 digest.
+
+    Uses hashlib.file_digest on Python 3.11+, which hashes straight from the
+    file descriptor; older versions hash the file in DOWNLOAD_CHUNK_SIZE
+    pieces. Either way the file is never read into memory whole.
+
+    Args:
+        path: File to hash
+        expected: Expected digest as a hex string (case-insensitive)
+
+    Returns:
+        True if the file's SHA-256 digest matches expected
+
+    Raises:
+        FileSystemError: If the file cannot be read
+    """
+    try:
+        with Path(path).open("rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256")
+            else:  # Python < 3.11
+                digest = hashlib.sha256()
+                for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    digest.update(block)
+    except OSError as e:
+        msg = f"Cannot read file for verification: {e}"
+        raise FileSystemError(msg, path=str(path)) from e
+    return digest.hexdigest() == expected.strip().lower()
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """Outcome of a successful download_file call.
+
+    Attributes:
+        bytes_downloaded: Body bytes received by this call; excludes bytes a
+                          resumed download already had on disk
+        elapsed: Wall-clock seconds the call took, including the request
+        not_modified: True if the server answered 304 and the existing file
+                      was kept
+    """
+
+    bytes_downloaded: int
+    elapsed: float
+    not_modified: bool = False
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average transfer rate of this call (0.0 if it took no time)."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
 def download_file(
     url: str,
     destination_path: str,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> None:
+    content_buffer: Optional[BinaryIO] = None,
+    *,
+    resume: bool = False,
+    conditional: bool = False,
+    progress_min_interval: float = PROGRESS_MIN_INTERVAL,
+    chunk_size: Optional[int] = None,
+) -> DownloadResult:
     """Download a file from URL to destination path.
 
+    The body is streamed to partial_download_path(destination_path) and
+    renamed over destination_path only once complete, so an interrupted
+    download never leaves a truncated file at the destination.
+
     Args:
         url: Source URL to download from
         destination_path: Local file path to save to
         progress_callback: Optional callback for progress tracking.
                           Called with (bytes_downloaded, total_bytes).
                           total_bytes is -1 if Content-Length is unknown.
+        content_buffer: Optional in-memory sink (e.g. io.BytesIO) that also
+                        receives the downloaded bytes, so callers can parse
+                        the file without reading it back from disk.
+        resume: Continue the partial file left by an earlier failed download
+                (see partial_download_path), requesting only the missing
+                bytes with an HTTP Range header. If the server answers with
+                the full file it is downloaded from scratch; a 416 answer
+                either confirms the partial file is complete or restarts the
+                download. The partial file is kept when the transfer fails.
+        conditional: Remember the ETag/Last-Modified of each download in a
+                     sidecar file (destination_path + ".etag") and send
+                     them on the next download of the same path. If the
+                     server answers 304 Not Modified, the existing file is
+                     left untouched.
+        progress_min_interval: Minimum seconds between progress callbacks.
+                               The final update is always delivered; pass
+                               0.0 to report every chunk.
+        chunk_size: Bytes read per step. Defaults to DOWNLOAD_CHUNK_SIZE when
+                    a progress callback is given, otherwise BULK_CHUNK_SIZE.
+
+    Returns:
+        DownloadResult with the bytes transferred and time taken, so callers
+        can measure throughput without instrumenting the call themselves
 
     Raises:
         ValidationError: If input parameters are invalid
@@ -454,31 +1124,260 @@ def download_file(
         HTTPError: If HTTP response indicates an error
         FileSystemError: If file operations fail
     """
+    started = time.perf_counter()
+
     # Input validation
     _validate_download_inputs(url, destination_path)
 
     # Prepare destination directory
     dest_path = _prepare_destination(destination_path)
 
-    # Fetch HTTP response with retry logic for network failures
-    response = _fetch_response_with_retry(url)
+    # Validators only exist for complete downloads, which need no Range
+    headers = _conditional_headers(dest_path) if conditional else {}
 
-    # Get content length
-    total_bytes = _get_content_length(response)
+    # Ask only for the missing tail of a partial download
+    part_path = partial_download_path(dest_path)
+    offset = _existing_size(part_path) if resume and not headers else 0
 
-    # Write content to file
-    bytes_downloaded = _write_content_to_file(
-        response, dest_path, progress_callback, total_bytes
-    )
+    # Already-compressed files would only cost a decompression pass
+    if _is_precompressed_url(url):
+        headers["Accept-Encoding"] = "identity"
+
+    # Fetch HTTP response with retry logic for network failures
+    response, offset = _fetch_resumable(url, headers, part_path, offset)
+    if response is None:
+        # The partial file already held the whole body
+        _finish_partial(part_path, dest_path, content_buffer)
+        return DownloadResult(0, time.perf_counter() - started)
+
+    # Streamed responses hold a pooled connection until closed
+    with contextlib.closing(response):
+        if response.status_code == HTTP_NOT_MODIFIED:
+            logger.info("Not modified since last download, keeping %s", dest_path)
+            if content_buffer is not None:
+                content_buffer.write(dest_path.read_bytes())
+            return DownloadResult(0, time.perf_counter() - started, not_modified=True)
+
+        # The old validators no longer describe the file once it is rewritten
+        if conditional:
+            _validators_path(dest_path).unlink(missing_ok=True)
+
+        # Get full file size and where this response's body starts
+        offset, total_bytes = _resolve_resume(response, offset)
+        if offset and content_buffer is not None:
+            content_buffer.write(part_path.read_bytes()[:offset])
+
+        # Write content to file
+        if chunk_size is None:
+            observed = progress_callback is not None
+            chunk_size = DOWNLOAD_CHUNK_SIZE if observed else BULK_CHUNK_SIZE
+        try:
+            bytes_downloaded = _write_content_to_file(
+                _iter_body(response, chunk_size),
+                part_path,
+                progress_callback,
+                total_bytes,
+                content_buffer=content_buffer,
+                start_offset=offset,
+                keep_partial=resume,
+                progress_min_interval=progress_min_interval,
+            )
+        except requests.exceptions.RequestException as e:
+            msg = f"Connection lost during download: {e}"
+            raise NetworkError(msg, details={"url": url}) from e
 
     # Content validation if size is known
-    if total_bytes > 0 and bytes_downloaded != total_bytes:
-        # Clean up incomplete file
-        if dest_path.exists():
-            with contextlib.suppress(OSError):
-                dest_path.unlink()
-        msg = f"Download incomplete: expected {total_bytes} bytes, got {bytes_downloaded} bytes"
-        raise ValidationError(
-            msg,
-            details={"expected_bytes": total_bytes, "actual_bytes": bytes_downloaded},
+    _check_complete(part_path, bytes_downloaded, total_bytes, keep_partial=resume)
+    _finish_partial(part_path, dest_path)
+
+    if conditional:
+        _save_validators(dest_path, response)
+
+    return DownloadResult(bytes_downloaded - offset, time.perf_counter() - started)
+
+
+def _default_download_workers() -> int:
+    """Return the worker count from PAPERS_DOWNLOAD_WORKERS, or the default."""
+    value = os.environ.get("PAPERS_DOWNLOAD_WORKERS")
+    if value:
+        with contextlib.suppress(ValueError):
+            workers = int(value)
+            if workers > 0:
+                return workers
+    return DEFAULT_DOWNLOAD_WORKERS
+
+
+class _AggregateProgress:
+    """Combine per-file progress from concurrent downloads into one total.
+
+    Workers report through per-file _FileProgress objects, which batch their
+    updates and take the shared lock about once per AGGREGATE_FLUSH_BYTES,
+    so lock traffic scales with megabytes rather than chunks.
+    """
+
+    def __init__(self, callback: Callable[[int, int], None]) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._known_total = 0
+        self._unknown_totals = 0
+
+    def for_file(self) -> "_FileProgress":
+        """Return a progress callback for one file, to be used by one worker."""
+        return _FileProgress(self)
+
+    def publish(self, delta: int, old_total: Optional[int], new_total: int) -> None:
+        """Add a file's unpublished bytes and update its share of the total.
+
+        Args:
+            delta: Bytes downloaded since the file last published
+            old_total: Total the file published before (None the first time)
+            new_total: File's current total (-1 if unknown)
+        """
+        with self._lock:
+            self._downloaded += delta
+            if old_total != new_total:
+                if old_total is not None:
+                    self._count_total(old_total, -1)
+                self._count_total(new_total, 1)
+            total = -1 if self._unknown_totals else self._known_total
+            self._callback(self._downloaded, total)
+
+    def _count_total(self, total: int, sign: int) -> None:
+        if total < 0:
+            self._unknown_totals += sign
+        else:
+            self._known_total += sign * total
+
+
+class _FileProgress:
+    """Per-file progress feeding an _AggregateProgress in batches.
+
+    The first update publishes straight away so the file's size joins the
+    total early; after that only every AGGREGATE_FLUSH_BYTES, on completion,
+    or on flush().
+    """
+
+    def __init__(self, aggregate: _AggregateProgress) -> None:
+        self._aggregate = aggregate
+        self._done = 0
+        self._total: Optional[int] = None
+        self._published_done = 0
+        self._published_total: Optional[int] = None
+
+    def __call__(self, bytes_downloaded: int, total_bytes: int) -> None:
+        self._done = bytes_downloaded
+        self._total = total_bytes
+        if (
+            total_bytes != self._published_total
+            or bytes_downloaded == total_bytes
+            or bytes_downloaded - self._published_done >= AGGREGATE_FLUSH_BYTES
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish any progress not yet reported to the aggregate."""
+        if self._total is None or (
+            self._done == self._published_done and self._total == self._published_total
+        ):
+            return
+        self._aggregate.publish(
+            self._done - self._published_done, self._published_total, self._total
         )
+        self._published_done = self._done
+        self._published_total = self._total
+
+
+def _download_and_flush(
+    download: Callable[[str, str, Optional[Callable[[int, int], None]]], object],
+    url: str,
+    destination_path: str,
+    progress: Optional[_FileProgress],
+) -> None:
+    """Run one batch download, publishing its final progress however it ends."""
+    try:
+        download(url, destination_path, progress)
+    finally:
+        if progress is not None:
+            progress.flush()
+
+
+def download_files(
+    url_dest_pairs: Iterable[tuple[str, str]],
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    *,
+    http2: bool = False,
+) -> Iterator[tuple[str, Optional[Exception]]]:
+    """Download several files concurrently.
+
+    Downloads are I/O bound, so threads overlap the time spent waiting on
+    sockets. Each download goes through download_file and the shared session
+    unless http2 is set.
+
+    Args:
+        url_dest_pairs: (url, destination_path) pairs to download
+        max_workers: Maximum concurrent downloads. Defaults to the
+                     PAPERS_DOWNLOAD_WORKERS environment variable, or
+                     DEFAULT_DOWNLOAD_WORKERS when unset.
+        progress_callback: Optional callback receiving combined progress as
+                          (bytes_downloaded, total_bytes) across all files.
+                          total_bytes is -1 while any started file has an
+                          unknown Content-Length.
+        http2: Send larger batches from a single origin over one multiplexed
+               HTTP/2 connection when httpx is installed (see download_h2).
+               That client does not retry 429/503 responses or resume
+               partial files, so it is off by default.
+
+    Yields:
+        (url, error) in completion order; error is None on success, otherwise
+        the exception download_file raised for that URL
+    """
+    pairs = list(url_dest_pairs)
+
+    if http2:
+        # download_h2 builds on this module, so it can only be imported lazily
+        from . import download_h2  # noqa: PLC0415
+
+        if download_h2.should_use_http2([url for url, _ in pairs]):
+            with download_h2.create_client() as client:
+                yield from _run_downloads(
+                    pairs,
+                    functools.partial(download_h2.download_file_h2, client),
+                    max_workers,
+                    progress_callback,
+                )
+            return
+
+    yield from _run_downloads(pairs, download_file, max_workers, progress_callback)
+
+
+def _run_downloads(
+    pairs: list[tuple[str, str]],
+    download: Callable[[str, str, Optional[Callable[[int, int], None]]], object],
+    max_workers: Optional[int],
+    progress_callback: Optional[Callable[[int, int], None]],
+) -> Iterator[tuple[str, Optional[Exception]]]:
+    """Run download(url, destination_path, progress) for each pair on a pool.
+
+    See download_files for the arguments and yielded values.
+    """
+    if max_workers is None:
+        max_workers = _default_download_workers()
+
+    aggregate = _AggregateProgress(progress_callback) if progress_callback else None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future[None], str] = {}
+        for url, destination_path in pairs:
+            file_progress = aggregate.for_file() if aggregate else None
+            future = executor.submit(
+                _download_and_flush, download, url, destination_path, file_progress
+            )
+            futures[future] = url
+
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None and not isinstance(error, Exception):
+                raise error  # KeyboardInterrupt and friends are not per-file
+            yield futures[future], error
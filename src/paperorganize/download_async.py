@@ -0,0 +1,333 @@
+# ABOUTME: Optional asyncio backend for downloading many URLs with aiohttp
+# ABOUTME: Fans out hundreds of concurrent downloads on a single event loop
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import functools
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+from .download import (
+    BACKOFF_MULTIPLIER,
+    INITIAL_RETRY_DELAY,
+    MAX_NETWORK_RETRIES,
+    PROGRESS_MIN_INTERVAL,
+    _AggregateProgress,
+    _check_complete,
+    _content_length_from_headers,
+    _finish_partial,
+    _is_non_retryable_status,
+    _preallocate,
+    _prepare_destination,
+    _RateLimitedProgress,
+    _remove_partial_file,
+    _trim_preallocation,
+    _validate_download_inputs,
+    _write_all,
+    calculate_retry_delay,
+    partial_download_path,
+)
+from .exceptions import FileSystemError, HTTPError, NetworkError
+
+try:
+    import aiohttp
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+else:
+    AIOHTTP_AVAILABLE = True
+
+# Coroutines are cheap, so far more downloads can be in flight than threads
+DEFAULT_MAX_CONCURRENT = 350
+
+REQUEST_TIMEOUT = 30.0
+
+# Seconds resolved host addresses are reused across a batch's connections
+DNS_CACHE_TTL = 300
+
+T = TypeVar("T")
+
+# Received chunks are joined up to this size before each disk write, so a
+# body arriving in small network reads costs far fewer write() calls and
+# executor round trips
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+async def _with_retry_async(
+    func: Callable[[], Awaitable[T]],
+    max_retries: int,
+    retryable_exceptions: tuple[type[Exception], ...],
+    initial_delay: float = INITIAL_RETRY_DELAY,
+    multiplier: float = BACKOFF_MULTIPLIER,
+) -> T:
+    """Await func with the backoff policy of download.with_retry.
+
+    The delays come from the same calculate_retry_delay, but are slept with
+    asyncio.sleep so other downloads keep running meanwhile.
+
+    Raises:
+        The final exception if all retries are exhausted
+        Any non-retryable exception immediately
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except retryable_exceptions as e:  # noqa: PERF203
+            if attempt == max_retries or _is_non_retryable_status(e):
+                raise
+            await asyncio.sleep(
+                calculate_retry_delay(attempt, initial_delay, multiplier)
+            )
+
+    # This should never happen, but for type checker completeness
+    error_msg = "Retry logic failed unexpectedly"
+    raise RuntimeError(error_msg)
+
+
+async def _open_response(
+    session: "aiohttp.ClientSession", url: str
+) -> "aiohttp.ClientResponse":
+    """Send a GET, retrying connection failures and timeouts with backoff.
+
+    Args:
+        session: Session to send the request on
+        url: Source URL to download from
+
+    Returns:
+        Response with the body unread; callers must release it
+
+    Raises:
+        NetworkError: If the request fails after all retries
+        HTTPError: If HTTP response indicates an error (no retry)
+    """
+    try:
+        response = await _with_retry_async(
+            lambda: session.get(url),
+            max_retries=MAX_NETWORK_RETRIES,
+            retryable_exceptions=(aiohttp.ClientConnectionError, asyncio.TimeoutError),
+        )
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+        msg = f"Connection failed: {e}"
+        raise NetworkError(msg, details={"url": url}) from e
+    except aiohttp.ClientError as e:
+        msg = f"Request failed: {e}"
+        raise NetworkError(msg, details={"url": url}) from e
+
+    # Handle HTTP status errors (no retry)
+    if not response.ok:
+        response.release()
+        msg = f"HTTP request failed: {response.status} {response.reason}"
+        raise HTTPError(msg, status_code=response.status, url=url)
+
+    return response
+
+
+def _close_after_write(fd: int, write: "asyncio.Future[None]") -> None:
+    """Close fd once an abandoned executor write to it has finished."""
+    # Retrieve the outcome so a failed write is not logged as unhandled
+    if not write.cancelled():
+        write.exception()
+    os.close(fd)
+
+
+async def _stream_to_file(
+    response: "aiohttp.ClientResponse",
+    dest_path: Path,
+    total_bytes: int,
+    progress: _RateLimitedProgress,
+) -> int:
+    """Write a response body to dest_path without blocking the event loop.
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        NetworkError: If the connection fails mid-body
+        FileSystemError: If file operations fail
+    """
+    loop = asyncio.get_running_loop()
+    bytes_downloaded = 0
+    pending: list[bytes] = []
+    pending_size = 0
+    write: Optional[asyncio.Future[None]] = None
+
+    async def flush_pending() -> None:
+        nonlocal bytes_downloaded, pending_size, write
+        # Disk writes go to the default executor so other downloads keep
+        # receiving while this one flushes. The shield keeps cancellation
+        # from marking the write done while the thread still uses fd.
+        write = loop.run_in_executor(None, _write_all, fd, b"".join(pending))
+        await asyncio.shield(write)
+        bytes_downloaded += pending_size
+        pending.clear()
+        pending_size = 0
+        progress(bytes_downloaded, total_bytes)
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(dest_path, flags, 0o666)
+        reserved = _preallocate(fd, total_bytes)
+        try:
+            # iter_chunks hands over buffers as received; iter_chunked would
+            # copy them into fixed-size blocks first
+            async for chunk, _ in response.content.iter_chunks():
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= WRITE_BUFFER_SIZE:
+                    await flush_pending()
+            if pending_size:
+                await flush_pending()
+        finally:
+            if write is None or write.done():
+                # A failed trim must not leak the descriptor
+                try:
+                    _trim_preallocation(fd, bytes_downloaded, reserved)
+                finally:
+                    os.close(fd)
+            else:
+                # Cancelled mid-flush: close once the executor is done with fd
+                write.add_done_callback(functools.partial(_close_after_write, fd))
+        progress.flush()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _remove_partial_file(dest_path)
+        msg = f"Connection lost during download: {e}"
+        raise NetworkError(msg, details={"url": str(response.url)}) from e
+    except OSError as e:
+        _remove_partial_file(dest_path)
+        msg = f"File operation failed: {e}"
+        raise FileSystemError(msg, path=str(dest_path)) from e
+    except BaseException:
+        # Includes cancellation, which must not leave a truncated file behind
+        _remove_partial_file(dest_path)
+        raise
+
+    return bytes_downloaded
+
+
+def create_session(
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+) -> "aiohttp.ClientSession":
+    """Create a session sized for max_concurrent simultaneous downloads.
+
+    Must be called from a running event loop; callers close the session.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=max_concurrent, ttl_dns_cache=DNS_CACHE_TTL
+        ),
+        # No total limit for large files, but a stalled connection or body
+        # read still fails after REQUEST_TIMEOUT like the requests backend
+        timeout=aiohttp.ClientTimeout(
+            total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT
+        ),
+    )
+
+
+async def download_file_async(
+    session: "aiohttp.ClientSession",
+    url: str,
+    destination_path: str,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Download a file from URL to destination path on the event loop.
+
+    Args:
+        session: Session from create_session (or any aiohttp.ClientSession)
+        url: Source URL to download from
+        destination_path: Local file path to save to
+        progress_callback: Optional callback for progress tracking.
+                          Called with (bytes_downloaded, total_bytes).
+                          total_bytes is -1 if Content-Length is unknown.
+
+    Raises:
+        ValidationError: If input parameters are invalid or the download
+                         is incomplete
+        NetworkError: If network request fails
+        HTTPError: If HTTP response indicates an error
+        FileSystemError: If file operations fail
+    """
+    _validate_download_inputs(url, destination_path)
+    dest_path = _prepare_destination(destination_path)
+
+    part_path = partial_download_path(dest_path)
+
+    response = await _open_response(session, url)
+    try:
+        total_bytes = _content_length_from_headers(response.headers)
+        progress = _RateLimitedProgress(progress_callback, PROGRESS_MIN_INTERVAL)
+        bytes_downloaded = await _stream_to_file(
+            response, part_path, total_bytes, progress
+        )
+    finally:
+        response.release()
+
+    _check_complete(part_path, bytes_downloaded, total_bytes, keep_partial=False)
+    _finish_partial(part_path, dest_path)
+
+
+async def download_files_async(
+    url_dest_pairs: Iterable[tuple[str, str]],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> list[tuple[str, Optional[Exception]]]:
+    """Download several files concurrently on the running event loop.
+
+    Args:
+        url_dest_pairs: (url, destination_path) pairs to download
+        max_concurrent: Maximum downloads in flight at once
+        progress_callback: Optional callback receiving combined progress as
+                          (bytes_downloaded, total_bytes) across all files.
+                          total_bytes is -1 while any started file has an
+                          unknown Content-Length.
+
+    Returns:
+        (url, error) for each pair in input order; error is None on success,
+        otherwise the exception raised for that URL
+    """
+    pairs = list(url_dest_pairs)
+    aggregate = _AggregateProgress(progress_callback) if progress_callback else None
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async with create_session(max_concurrent) as session:
+
+        async def run(url: str, destination_path: str) -> Optional[Exception]:
+            file_progress = aggregate.for_file() if aggregate else None
+            async with semaphore:
+                try:
+                    await download_file_async(
+                        session, url, destination_path, file_progress
+                    )
+                except Exception as e:  # reported per URL
+                    return e
+                finally:
+                    if file_progress is not None:
+                        file_progress.flush()
+            return None
+
+        errors = await asyncio.gather(*(run(url, dest) for url, dest in pairs))
+
+    return [(url, error) for (url, _), error in zip(pairs, errors)]
+
+
+def download_files_blocking(
+    url_dest_pairs: Iterable[tuple[str, str]],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> list[tuple[str, Optional[Exception]]]:
+    """Blocking facade over download_files_async for synchronous callers.
+
+    Runs its own event loop, so it cannot be called from a coroutine; use
+    download_files_async there instead.
+
+    Args:
+        url_dest_pairs: (url, destination_path) pairs to download
+        max_concurrent: Maximum downloads in flight at once
+        progress_callback: Optional combined progress callback (see
+                          download_files_async)
+
+    Returns:
+        (url, error) for each pair in input order
+    """
+    return asyncio.run(
+        download_files_async(url_dest_pairs, max_concurrent, progress_callback)
+    )
@@ -0,0 +1,189 @@
+# ABOUTME: Optional HTTP/2 backend for batch downloads built on httpx
+# ABOUTME: Multiplexes many downloads from one host over a single connection
+# SPDX-License-Identifier: MIT
+
+import importlib.util
+from typing import Callable, Optional, Sequence
+from urllib.parse import urlparse
+
+from .download import (
+    BACKOFF_MULTIPLIER,
+    DOWNLOAD_CHUNK_SIZE,
+    INITIAL_RETRY_DELAY,
+    MAX_NETWORK_RETRIES,
+    _check_complete,
+    _content_length_from_headers,
+    _finish_partial,
+    _is_precompressed_url,
+    _prepare_destination,
+    _validate_download_inputs,
+    _write_content_to_file,
+    partial_download_path,
+    with_retry,
+)
+from .exceptions import HTTPError, NetworkError
+
+try:
+    import httpx
+except ImportError:
+    HTTPX_AVAILABLE = False
+else:
+    HTTPX_AVAILABLE = True
+
+# httpx needs the h2 package (the "http2" extra) to negotiate HTTP/2
+HTTP2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec("h2") is not None
+
+# Connection limits for the shared HTTP/2 client
+H2_MAX_CONNECTIONS = 16
+
+# Batches up to this size are not worth a second client
+H2_MIN_BATCH_SIZE = 4
+
+REQUEST_TIMEOUT = 30.0
+
+
+def should_use_http2(urls: Sequence[str]) -> bool:
+    """Check whether a batch should be routed through the HTTP/2 client.
+
+    Multiplexing only pays off for several requests to the same origin, so
+    the batch must be larger than H2_MIN_BATCH_SIZE and every URL must share
+    one scheme and host.
+
+    Args:
+        urls: URLs in the batch
+
+    Returns:
+        True if httpx with HTTP/2 support is installed and the batch qualifies
+    """
+    if not HTTP2_AVAILABLE or len(urls) <= H2_MIN_BATCH_SIZE:
+        return False
+    origins = {(parsed.scheme, parsed.netloc) for parsed in map(urlparse, urls)}
+    return len(origins) == 1
+
+
+def create_client(transport: "Optional[httpx.BaseTransport]" = None) -> "httpx.Client":
+    """Create an HTTP/2 client for batch downloads.
+
+    The client is thread-safe, so download_files shares one across workers
+    and their requests become streams on the same connection.
+
+    Args:
+        transport: Optional transport override (e.g. httpx.MockTransport)
+
+    Returns:
+        Configured httpx.Client; callers are responsible for closing it
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=H2_MAX_CONNECTIONS,
+            max_keepalive_connections=H2_MAX_CONNECTIONS,
+        ),
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        transport=transport,
+    )
+
+
+def _open_stream(client: "httpx.Client", url: str) -> "httpx.Response":
+    """Start a streaming GET with retry logic for network failures.
+
+    Args:
+        client: Client to send the request on
+        url: Source URL to download from
+
+    Returns:
+        Open streaming response; callers must close it
+
+    Raises:
+        NetworkError: If network request fails after all retries
+        HTTPError: If HTTP response indicates an error (no retry)
+    """
+
+    # Already-compressed files would only cost a decompression pass
+    headers = {"Accept-Encoding": "identity"} if _is_precompressed_url(url) else None
+
+    def make_request() -> "httpx.Response":
+        request = client.build_request("GET", url, headers=headers)
+        return client.send(request, stream=True)
+
+    try:
+        response = with_retry(
+            make_request,
+            max_retries=MAX_NETWORK_RETRIES,
+            retryable_exceptions=(httpx.TransportError,),
+            initial_delay=INITIAL_RETRY_DELAY,
+            multiplier=BACKOFF_MULTIPLIER,
+        )
+    except httpx.TimeoutException as e:
+        msg = f"Request timed out after {REQUEST_TIMEOUT:g} seconds"
+        raise NetworkError(msg, details={"url": url}) from e
+    except httpx.TransportError as e:
+        msg = f"Connection failed: {e}"
+        raise NetworkError(msg, details={"url": url}) from e
+    except httpx.HTTPError as e:
+        msg = f"Request failed: {e}"
+        raise NetworkError(msg, details={"url": url}) from e
+
+    # Handle HTTP status errors (no retry)
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        response.close()
+        msg = f"HTTP request failed: {e}"
+        raise HTTPError(msg, status_code=response.status_code, url=url) from e
+
+    return response
+
+
+def download_file_h2(
+    client: "httpx.Client",
+    url: str,
+    destination_path: str,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Download a file over a shared HTTP/2 client.
+
+    Mirrors download.download_file for batch use; resume, 429/503 status
+    retries and the streaming hooks of the single-file API are not
+    supported here.
+
+    Args:
+        client: Client from create_client
+        url: Source URL to download from
+        destination_path: Local file path to save to
+        progress_callback: Optional callback for progress tracking.
+                          Called with (bytes_downloaded, total_bytes).
+                          total_bytes is -1 if Content-Length is unknown.
+
+    Raises:
+        ValidationError: If input parameters are invalid or the download
+                         is incomplete
+        NetworkError: If network request fails
+        HTTPError: If HTTP response indicates an error
+        FileSystemError: If file operations fail
+    """
+    _validate_download_inputs(url, destination_path)
+    dest_path = _prepare_destination(destination_path)
+
+    part_path = partial_download_path(dest_path)
+
+    response = _open_stream(client, url)
+    try:
+        total_bytes = _content_length_from_headers(response.headers)
+        try:
+            bytes_downloaded = _write_content_to_file(
+                response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                part_path,
+                progress_callback,
+                total_bytes,
+            )
+        except httpx.HTTPError as e:
+            # The partial file is already gone; only the error needs mapping
+            msg = f"Connection lost during download: {e}"
+            raise NetworkError(msg, details={"url": url}) from e
+    finally:
+        response.close()
+
+    _check_complete(part_path, bytes_downloaded, total_bytes, keep_partial=False)
+    _finish_partial(part_path, dest_path)
@@ -2,9 +2,11 @@
 # ABOUTME: Determines whether input is URL, file, or directory for unified processing
 # SPDX-License-Identifier: MIT
 
+import os
 import re
 from enum import Enum
 from pathlib import Path
+from typing import Iterator
 from urllib.parse import urlparse
 
 from .exceptions import ValidationError
@@ -87,21 +89,33 @@ def detect_input_type(input_arg: str) -> InputType:
     )
 
 
-def validate_directory_contains_pdfs(directory: Path) -> list[Path]:
-    """Validate that a directory contains PDF files and return them.
+def iter_directory_pdfs(directory: Path) -> Iterator[Path]:
+    """Yield PDF files in a directory as they are discovered.
+
+    Uses os.scandir so file type checks come from the cached directory entry
+    rather than a separate stat per file. Files are yielded in directory
+    order, which depends on the filesystem; sort the result where a stable
+    order matters. The extension match is case-insensitive, and symlinks are
+    skipped rather than followed.
 
     Args:
-        directory: Path to directory to check
+        directory: Path to directory to scan
 
-    Returns:
-        List of PDF file paths found in directory
+    Yields:
+        PDF file paths found in directory
 
     Raises:
-        ValidationError: If directory contains no PDF files
+        ValidationError: If the scan finishes without finding any PDF files
     """
-    pdf_files = list(directory.glob("*.pdf"))
-
-    if not pdf_files:
+    found_pdf = False
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            is_pdf = entry.name.lower().endswith(".pdf")
+            if is_pdf and entry.is_file(follow_symlinks=False):
+                found_pdf = True
+                yield Path(entry.path)
+
+    if not found_pdf:
         raise ValidationError(
             f"No PDF files found in directory: {directory}",
             details={
@@ -110,4 +124,17 @@ def validate_directory_contains_pdfs(directory: Path) -> list[Path]:
             },
         )
 
-    return sorted(pdf_files)
+
+def validate_directory_contains_pdfs(directory: Path) -> list[Path]:
+    """Validate that a directory contains PDF files and return them.
+
+    Args:
+        directory: Path to directory to check
+
+    Returns:
+        Sorted list of PDF file paths found in directory
+
+    Raises:
+        ValidationError: If directory contains no PDF files
+    """
+    return sorted(iter_directory_pdfs(directory))
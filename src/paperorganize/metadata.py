@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import io
 import logging
 import re
 import unicodedata
@@ -40,7 +41,7 @@ def _is_valid_academic_year(year: int) -> bool:
     return MIN_ACADEMIC_YEAR <= year <= current_year + MAX_YEAR_OFFSET
 
 
-def extract_pdf_metadata(pdf_path: str) -> PaperMetadata:
+def extract_pdf_metadata(pdf_path: str, content: bytes | None = None) -> PaperMetadata:
     """Extract metadata from PDF using layered approach.
 
     Uses multiple extraction methods in order of reliability:
@@ -50,18 +51,24 @@ def extract_pdf_metadata(pdf_path: str) -> PaperMetadata:
 
     Args:
         pdf_path: Path to PDF file
+        content: The file's bytes if already in memory; pypdf parses these
+                 instead of reading pdf_path back from disk
 
     Returns:
         PaperMetadata: Structured metadata object
     """
     metadata = PaperMetadata()
 
+    # Parse the PDF once and share the reader across extraction layers
+    reader = _open_pdf_reader(pdf_path, content)
+
     # Layer 1: Try pypdf for basic metadata
-    _extract_with_pypdf(pdf_path, metadata)
+    if reader is not None:
+        _extract_with_pypdf(reader, pdf_path, metadata)
 
     # Layer 2: Try enhanced extraction pipeline for academic identifiers
     if ENHANCED_EXTRACTION_AVAILABLE:
-        _extract_with_enhanced_pipeline(pdf_path, metadata)
+        _extract_with_enhanced_pipeline(pdf_path, metadata, reader)
 
     # Layer 3: Extract year from title if not found yet
     if not metadata.year and metadata.title:
@@ -114,13 +121,26 @@ def _extract_year_from_title(title: str, metadata: PaperMetadata) -> None:
                 continue
 
 
-def _extract_with_pypdf(pdf_path: str, metadata: PaperMetadata) -> None:
-    """Extract basic metadata using pypdf."""
+def _open_pdf_reader(pdf_path: str, content: bytes | None = None) -> PdfReader | None:
+    """Open a PDF with pypdf, returning None if unavailable or unreadable."""
     if not PDF_READER_AVAILABLE:
-        return
+        return None
+
+    try:
+        if content is not None:
+            return PdfReader(io.BytesIO(content))
+        return PdfReader(pdf_path)
+    except Exception as e:
+        # Log error but continue gracefully if pypdf fails
+        logger.debug("Failed to open %s with pypdf: %s", pdf_path, e)
+        return None
+
 
+def _extract_with_pypdf(
+    reader: PdfReader, pdf_path: str, metadata: PaperMetadata
+) -> None:
+    """Extract basic metadata from an open pypdf reader."""
     try:
-        reader = PdfReader(pdf_path)
         if hasattr(reader, "metadata") and reader.metadata:
             pdf_meta = reader.metadata
 
@@ -147,14 +167,16 @@ def _extract_with_pypdf(pdf_path: str, metadata: PaperMetadata) -> None:
         logger.debug("Failed to extract metadata with pypdf from %s: %s", pdf_path, e)
 
 
-def _extract_with_enhanced_pipeline(pdf_path: str, metadata: PaperMetadata) -> None:
+def _extract_with_enhanced_pipeline(
+    pdf_path: str, metadata: PaperMetadata, reader: PdfReader | None = None
+) -> None:
     """Extract academic identifiers using enhanced extraction pipeline."""
     if not ENHANCED_EXTRACTION_AVAILABLE:
         return
 
     try:
         extractor = EnhancedMetadataExtractor()
-        extractor.extract_identifiers_and_enrich(pdf_path, metadata)
+        extractor.extract_identifiers_and_enrich(pdf_path, metadata, reader=reader)
         logger.debug("Enhanced extraction completed for %s", pdf_path)
     except Exception as e:
         # Log error but continue gracefully if enhanced extraction fails
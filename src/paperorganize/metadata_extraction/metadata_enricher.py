@@ -12,7 +12,7 @@ Coordinates the complete extraction pipeline:
 """
 
 import logging
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from paperorganize.models import PaperMetadata
 
@@ -20,6 +20,9 @@ from .api_clients import ArxivClient, CrossRefClient
 from .pattern_matchers import IdentifierMatch, find_arxiv_patterns, find_doi_patterns
 from .text_extractors import PdfPlumberExtractor, PDFTextExtractor, PyPDFExtractor
 
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,16 +41,21 @@ class EnhancedMetadataExtractor:
         ]
 
     def extract_identifiers_and_enrich(
-        self, pdf_path: str, metadata: PaperMetadata
+        self,
+        pdf_path: str,
+        metadata: PaperMetadata,
+        reader: Optional["PdfReader"] = None,
     ) -> None:
         """Extract identifiers from PDF and enrich metadata via APIs.
 
         Args:
             pdf_path: Path to PDF file
             metadata: PaperMetadata object to enrich (modified in place)
+            reader: Already-open pypdf reader for pdf_path, reused instead of
+                    parsing the file again
         """
         # Step 1: Extract text using fallback chain
-        text = self._extract_text_with_fallback(pdf_path)
+        text = self._extract_text_with_fallback(pdf_path, reader)
         if not text:
             logger.debug("No text extracted from %s", pdf_path)
             return
@@ -62,18 +70,24 @@ class EnhancedMetadataExtractor:
 
         logger.debug("Enhanced extraction completed for %s", pdf_path)
 
-    def _extract_text_with_fallback(self, pdf_path: str) -> str:
+    def _extract_text_with_fallback(
+        self, pdf_path: str, reader: Optional["PdfReader"] = None
+    ) -> str:
         """Extract text using extractor fallback chain.
 
         Args:
             pdf_path: Path to PDF file
+            reader: Optional already-open pypdf reader for pdf_path
 
         Returns:
             str: Extracted text or empty string if all extractors fail
         """
         for extractor in self.text_extractors:
             try:
-                text = extractor.extract_text(pdf_path)
+                if reader is not None and isinstance(extractor, PyPDFExtractor):
+                    text = extractor.extract_text_from_reader(reader)
+                else:
+                    text = extractor.extract_text(pdf_path)
                 if text.strip():
                     extractor_name = extractor.__class__.__name__
                     logger.debug("Successfully extracted text using %s", extractor_name)
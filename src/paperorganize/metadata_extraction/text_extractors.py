@@ -9,11 +9,37 @@ Provides multiple text extraction strategies:
 2. PyPDFExtractor - Reliable fallback using existing pypdf dependency
 """
 
+import functools
 import logging
-from typing import Protocol
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
 
 logger = logging.getLogger(__name__)
 
+# Seconds pdfplumber may spend on a document before later pages are skipped.
+# Checked between pages, so a single slow page can still run past it.
+PDFPLUMBER_TIME_BUDGET = 10.0
+
+
+@functools.cache
+def _import_pdfplumber() -> ModuleType:
+    """Import pdfplumber on first use and reuse the module afterwards."""
+    import pdfplumber
+
+    return pdfplumber
+
+
+@functools.cache
+def _import_pypdf() -> ModuleType:
+    """Import pypdf on first use and reuse the module afterwards."""
+    import pypdf
+
+    return pypdf
+
 
 class PDFTextExtractor(Protocol):
     """Protocol for PDF text extraction implementations."""
@@ -49,12 +75,13 @@ class PdfPlumberExtractor:
             Exception: pdfplumber import or processing errors
         """
         try:
-            import pdfplumber
+            pdfplumber = _import_pdfplumber()
         except ImportError as e:
             msg = "pdfplumber not available"
             raise ImportError(msg) from e
 
         text_parts = []
+        deadline = time.monotonic() + PDFPLUMBER_TIME_BUDGET
 
         try:
             with pdfplumber.open(pdf_path) as pdf:
@@ -68,6 +95,16 @@ class PdfPlumberExtractor:
                     if page_text:
                         text_parts.append(page_text.strip())
 
+                    # Skip the remaining pages once the budget is spent; the
+                    # page in progress is never interrupted
+                    if time.monotonic() > deadline:
+                        logger.debug(
+                            "pdfplumber time budget exceeded for %s after %d pages",
+                            pdf_path,
+                            page_num + 1,
+                        )
+                        break
+
                     # Early exit optimization - stop when we have enough text
                     # for pattern matching (typically first page has identifiers)
                     text_extraction_limit = (
@@ -99,34 +136,44 @@ class PyPDFExtractor:
             Exception: pypdf import or processing errors
         """
         try:
-            from pypdf import PdfReader
+            pypdf = _import_pypdf()
         except ImportError as e:
             msg = "pypdf library not available"
             raise ImportError(msg) from e
 
-        text_parts = []
-
         try:
-            reader = PdfReader(pdf_path)
-            # Process first 5 pages only for performance
-            max_pages = min(5, len(reader.pages))
+            return self.extract_text_from_reader(pypdf.PdfReader(pdf_path))
+        except Exception as e:
+            logger.debug("pypdf extraction failed for %s: %s", pdf_path, e)
+            raise
 
-            for page_num in range(max_pages):
-                page = reader.pages[page_num]
-                page_text = page.extract_text()
+    def extract_text_from_reader(self, reader: "PdfReader") -> str:
+        """Extract text from an already-open pypdf reader.
 
-                if page_text:
-                    text_parts.append(page_text.strip())
+        Args:
+            reader: pypdf reader for the PDF
 
-                # Early exit optimization
-                text_extraction_limit = (
-                    5000  # Reasonable text limit for pattern matching
-                )
-                if len("".join(text_parts)) > text_extraction_limit:
-                    break
+        Returns:
+            str: Extracted text content
 
-        except Exception as e:
-            logger.debug("pypdf extraction failed for %s: %s", pdf_path, e)
-            raise
+        Raises:
+            Exception: pypdf processing errors
+        """
+        text_parts = []
+
+        # Process first 5 pages only for performance
+        max_pages = min(5, len(reader.pages))
+
+        for page_num in range(max_pages):
+            page = reader.pages[page_num]
+            page_text = page.extract_text()
+
+            if page_text:
+                text_parts.append(page_text.strip())
+
+            # Early exit optimization
+            text_extraction_limit = 5000  # Reasonable text limit for pattern matching
+            if len("".join(text_parts)) > text_extraction_limit:
+                break
 
         return "\n".join(text_parts)
@@ -7,9 +7,17 @@ from pathlib import Path
 import click
 
 from .metadata import extract_pdf_metadata, generate_filename
+from .models import PaperMetadata
+from .storage import resolve_name_conflict
 
 
-def apply_metadata_naming(file_path: Path, *, quiet: bool) -> Path:
+def apply_metadata_naming(
+    file_path: Path,
+    *,
+    quiet: bool,
+    metadata: PaperMetadata | None = None,
+    existing_names: set[str] | None = None,
+) -> Path:
     """Apply metadata-based naming to a PDF file.
 
     Extracts metadata from the PDF and renames it with an intelligent filename.
@@ -18,13 +26,17 @@ def apply_metadata_naming(file_path: Path, *, quiet: bool) -> Path:
     Args:
         file_path: Path to the PDF file to rename
         quiet: Whether to suppress output messages
+        metadata: Already-extracted metadata; skips re-reading the PDF if given
+        existing_names: Snapshot of filenames in the file's directory, used for
+            conflict checks instead of the filesystem and kept up to date
 
     Returns:
         Path to the final file (may be same as input if no rename needed)
     """
     try:
-        # Extract metadata
-        metadata = extract_pdf_metadata(str(file_path))
+        # Extract metadata unless the caller already has it
+        if metadata is None:
+            metadata = extract_pdf_metadata(str(file_path))
         new_filename = generate_filename(metadata, file_path.name)
 
         # If no change needed, return original
@@ -32,17 +44,12 @@ def apply_metadata_naming(file_path: Path, *, quiet: bool) -> Path:
             return file_path
 
         # Handle conflicts
-        new_path = file_path.parent / new_filename
-        counter = 1
-        original_new_path = new_path
-        while new_path.exists():
-            stem = original_new_path.stem
-            suffix = original_new_path.suffix
-            new_path = file_path.parent / f"{stem}_{counter}{suffix}"
-            counter += 1
+        new_path = resolve_name_conflict(file_path.parent, new_filename, existing_names)
 
         # Rename
         file_path.rename(new_path)
+        if existing_names is not None:
+            existing_names.discard(file_path.name)
 
         if not quiet:
             click.echo(f"✓ Renamed to: {new_path.name}")
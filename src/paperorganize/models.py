@@ -12,9 +12,12 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperMetadata:
-    """Structured metadata for academic papers."""
+    """Structured metadata for academic papers.
+
+    Uses __slots__ so per-paper instances stay small during batch processing.
+    """
 
     title: Optional[str] = None
     authors: Optional[List[str]] = None
@@ -2,17 +2,24 @@
 # ABOUTME: Strategy pattern implementation for unified paper processing
 # SPDX-License-Identifier: MIT
 
+import io
+import re
 from pathlib import Path
-from typing import Protocol
-from urllib.parse import urlparse
+from typing import Iterable, Protocol
 
 import click
 import requests
 
 from .download import download_file, get_download_info
 from .exceptions import HTTPError, NetworkError, ValidationError
-from .input_detection import normalize_url, validate_directory_contains_pdfs
+from .input_detection import iter_directory_pdfs, normalize_url
+from .metadata import extract_pdf_metadata
 from .metadata_naming import apply_metadata_naming
+from .storage import resolve_name_conflict
+
+# Last non-empty path segment of an absolute URL, skipping the authority and
+# ignoring trailing slashes, query string and fragment
+_URL_LAST_SEGMENT = re.compile(r"^[^:/?#]+://[^/?#]*/(?:[^?#]*/)?([^/?#]+)/*(?:[?#]|$)")
 
 
 class ProcessingResult:
@@ -73,19 +80,31 @@ class URLProcessor:
         filename = self._determine_filename(custom_name, url)
         temp_path = destination_dir / filename
 
-        # Download file
-        download_file(url, str(temp_path))
-
-        if not quiet:
-            click.echo(f"✓ Downloaded to: {temp_path}")
-
         # Apply metadata naming if enabled
         final_path = temp_path
         was_renamed = False
 
         if auto_name and custom_name is None:
-            final_path = apply_metadata_naming(temp_path, quiet=quiet)
+            # Keep the bytes in memory so extraction need not re-read the file
+            content_buffer = io.BytesIO()
+            download_file(url, str(temp_path), content_buffer=content_buffer)
+
+            if not quiet:
+                click.echo(f"✓ Downloaded to: {temp_path}")
+
+            metadata = extract_pdf_metadata(
+                str(temp_path), content=content_buffer.getvalue()
+            )
+
+            final_path = apply_metadata_naming(
+                temp_path, quiet=quiet, metadata=metadata
+            )
             was_renamed = final_path != temp_path
+        else:
+            download_file(url, str(temp_path))
+
+            if not quiet:
+                click.echo(f"✓ Downloaded to: {temp_path}")
 
         return [
             ProcessingResult(
@@ -116,8 +135,7 @@ class URLProcessor:
 
             # If server confirms it's a PDF but no filename, extract from URL and add .pdf
             if is_pdf_content:
-                parsed_url = urlparse(url)
-                filename = Path(parsed_url.path).name
+                filename = _url_last_segment(url)
                 if filename:
                     return (
                         filename + ".pdf" if not filename.endswith(".pdf") else filename
@@ -130,8 +148,7 @@ class URLProcessor:
             pass
 
         # Fallback: Extract from URL
-        parsed_url = urlparse(url)
-        filename = Path(parsed_url.path).name
+        filename = _url_last_segment(url)
         if not filename:
             filename = "paper.pdf"
         elif not filename.endswith(".pdf"):
@@ -139,6 +156,12 @@ class URLProcessor:
         return filename
 
 
+def _url_last_segment(url: str) -> str:
+    """Return the last path segment of a URL, or an empty string if none."""
+    match = _URL_LAST_SEGMENT.search(url)
+    return match.group(1) if match else ""
+
+
 class FileProcessor:
     """Processor for single file inputs - organizes existing PDFs."""
 
@@ -150,8 +173,14 @@ class FileProcessor:
         *,
         auto_name: bool,
         quiet: bool,
+        existing_names: set[str] | None = None,
     ) -> list[ProcessingResult]:
-        """Process existing PDF file."""
+        """Process existing PDF file.
+
+        existing_names is an optional snapshot of the filenames in
+        destination_dir; batch callers share one so conflict resolution does not
+        stat the filesystem for every candidate name.
+        """
         source_path = Path(input_arg)
 
         if not quiet:
@@ -169,14 +198,13 @@ class FileProcessor:
 
         # Copy or move file to destination if different
         if source_path.parent != destination_dir or filename != source_path.name:
-            # Handle conflicts
-            counter = 1
-            original_dest = destination_path
-            while destination_path.exists() and destination_path != source_path:
-                stem = original_dest.stem
-                suffix = original_dest.suffix
-                destination_path = destination_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
+            # Handle conflicts (a file never conflicts with itself)
+            own_name = (
+                source_path.name if source_path.parent == destination_dir else None
+            )
+            destination_path = resolve_name_conflict(
+                destination_dir, filename, existing_names, own_name=own_name
+            )
 
             # Copy file to destination
             if destination_path != source_path:
@@ -191,7 +219,9 @@ class FileProcessor:
         was_renamed = False
 
         if auto_name and custom_name is None:
-            final_path = apply_metadata_naming(destination_path, quiet=quiet)
+            final_path = apply_metadata_naming(
+                destination_path, quiet=quiet, existing_names=existing_names
+            )
             was_renamed = final_path != destination_path
 
         return [
@@ -219,19 +249,26 @@ class DirectoryProcessor:
         """Process all PDF files in directory."""
         source_dir = Path(input_arg)
 
-        # Find all PDF files
-        pdf_files = validate_directory_contains_pdfs(source_dir)
+        # Process PDF files as they are discovered. When organizing in place,
+        # snapshot the listing first so renamed files are not picked up again;
+        # the snapshot is sorted so conflict suffixes do not depend on the
+        # filesystem's directory order.
+        pdf_files: Iterable[Path] = iter_directory_pdfs(source_dir)
+        if source_dir.resolve() == destination_dir.resolve():
+            pdf_files = sorted(pdf_files)
 
         if not quiet:
             click.echo(f"→ Processing directory: {source_dir}")
-            click.echo(f"Found {len(pdf_files)} PDF files")
 
         results = []
         file_processor = FileProcessor()
 
-        for pdf_file in pdf_files:
+        # Snapshot destination names once so conflicts are resolved in memory
+        existing_names = {path.name for path in destination_dir.iterdir()}
+
+        for found, pdf_file in enumerate(pdf_files, start=1):
             if not quiet:
-                click.echo(f"\n  Processing: {pdf_file.name}")
+                click.echo(f"\n  Processing PDF {found}: {pdf_file.name}")
 
             # Process each file individually
             # Note: custom_name is ignored for batch processing
@@ -241,6 +278,7 @@ class DirectoryProcessor:
                 custom_name=None,  # No custom names in batch mode
                 auto_name=auto_name,
                 quiet=quiet,
+                existing_names=existing_names,
             )
             results.extend(file_results)
 
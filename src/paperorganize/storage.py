@@ -14,6 +14,47 @@ def ensure_directory(path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
+def resolve_name_conflict(
+    directory: Path,
+    filename: str,
+    existing_names: set[str] | None = None,
+    *,
+    own_name: str | None = None,
+) -> Path:
+    """Find a free path in directory by appending numbered suffixes.
+
+    Args:
+        directory: Directory the file will live in
+        filename: Desired filename
+        existing_names: Snapshot of filenames already in directory. When given,
+            conflicts are checked against it instead of stat-ing each candidate,
+            and the chosen name is added to it for subsequent calls.
+        own_name: Name of the file being placed, which never conflicts with itself
+
+    Returns:
+        Path: Available path (may have number appended)
+    """
+    stem = Path(filename).stem
+    suffix = Path(filename).suffix
+
+    def is_taken(name: str) -> bool:
+        if name == own_name:
+            return False
+        if existing_names is not None:
+            return name in existing_names
+        return (directory / name).exists()
+
+    candidate = filename
+    counter = 1
+    while is_taken(candidate):
+        candidate = f"{stem}_{counter}{suffix}"
+        counter += 1
+
+    if existing_names is not None:
+        existing_names.add(candidate)
+    return directory / candidate
+
+
 def resolve_conflicts(target_path: str) -> str:
     """Resolve filename conflicts by appending numbers.
 
@@ -23,10 +64,5 @@ def resolve_conflicts(target_path: str) -> str:
     Returns:
         str: Available file path (may have number appended)
     """
-    if not Path(target_path).exists():
-        return target_path
-
-    # TODO(claude): Implement conflict resolution with numbered suffixes
-    # TODO(claude): Handle edge cases like existing numbered files
-    msg = "Conflict resolution not yet implemented"
-    raise NotImplementedError(msg)
+    path = Path(target_path)
+    return str(resolve_name_conflict(path.parent, path.name))
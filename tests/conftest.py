@@ -2,7 +2,6 @@
 # ABOUTME: Provides HTTP server fixtures and test data for reliable CI testing
 # SPDX-License-Identifier: MIT
 
-import tempfile
 from pathlib import Path
 from typing import Generator
 
@@ -11,16 +10,13 @@ from pytest_httpserver import HTTPServer
 from werkzeug import Response
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def http_server() -> Generator[HTTPServer, None, None]:
-    """Create local HTTP server for testing without external dependencies."""
+    """Create local HTTP server for testing without external dependencies.
+
+    Started once per session; _clear_server resets its expectations after
+    each test.
+    """
     server = HTTPServer(host="127.0.0.1", port=0)  # Random available port
     server.start()
     try:
@@ -30,12 +26,30 @@ def http_server() -> Generator[HTTPServer, None, None]:
 
 
 @pytest.fixture
+def no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip real backoff delays between retried requests.
+
+    download calls time.sleep through the module, so this patches it for the
+    whole process; modules opt in with pytest.mark.usefixtures rather than
+    autouse, leaving slow-server handlers their real sleep.
+    """
+    monkeypatch.setattr("paperorganize.download.time.sleep", lambda *_: None)
+
+
+@pytest.fixture(autouse=True)
+def _clear_server(http_server: HTTPServer) -> Generator[None, None, None]:
+    """Drop handlers and request log registered by the previous test."""
+    yield
+    http_server.clear()
+
+
+@pytest.fixture(scope="session")
 def pdf_fixture_minimal() -> bytes:
     """Return minimal valid PDF content for testing."""
     return (Path(__file__).parent / "fixtures" / "test_paper_minimal.pdf").read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_fixture_with_metadata() -> bytes:
     """Return PDF content with extractable metadata for testing."""
     return (
@@ -43,7 +57,7 @@ def pdf_fixture_with_metadata() -> bytes:
     ).read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_pdf_content() -> bytes:
     """Generate larger PDF content for testing chunked downloads."""
     # Create a minimal but larger PDF by padding with whitespace
@@ -55,13 +69,13 @@ def large_pdf_content() -> bytes:
     return base_content + padding
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_binary_data() -> bytes:
     """Return invalid binary data that isn't a PDF."""
     return b"This is not a PDF file\x00\x01\x02\x03" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server_error_response() -> Response:
     """Create server error response for testing."""
     return Response(
@@ -71,7 +85,7 @@ def server_error_response() -> Response:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def not_found_response() -> Response:
     """Create 404 not found response for testing."""
     return Response(
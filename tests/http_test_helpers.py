@@ -2,6 +2,7 @@
 # ABOUTME: Provides helper functions for setting up HTTP server responses and scenarios
 # SPDX-License-Identifier: MIT
 
+import functools
 from typing import Dict, Optional, Union
 
 from pytest_httpserver import HTTPServer
@@ -117,12 +118,21 @@ def setup_large_file_response(
     Returns:
         Complete URL for the endpoint
     """
-    # Generate content by repeating pattern
+    content = _generate_content(size_bytes, chunk_pattern)
+    return setup_pdf_response(server, endpoint, content, content_type=content_type)
+
+
+@functools.lru_cache(maxsize=16)
+def _generate_content(size_bytes: int, chunk_pattern: bytes) -> bytes:
+    """Generate content of size_bytes by repeating chunk_pattern.
+
+    Cached because bytes are immutable and the same large blobs are requested
+    repeatedly across tests.
+    """
     content = chunk_pattern * (size_bytes // len(chunk_pattern))
     if len(content) < size_bytes:
         content += chunk_pattern[: size_bytes - len(content)]
-
-    return setup_pdf_response(server, endpoint, content, content_type=content_type)
+    return content
 
 
 def setup_slow_response(
@@ -2,11 +2,11 @@
 # ABOUTME: Tests unified input processing, argument parsing, and basic command execution
 # SPDX-License-Identifier: MIT
 
-import os
-import tempfile
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Generator
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 from click.testing import CliRunner
@@ -18,321 +18,362 @@ from paperorganize.cli import (
 )
 from paperorganize.exceptions import FileSystemError
 
+# Fragments test_cli_help expects, matched in a single pass over the help text
+HELP_FRAGMENTS = frozenset(
+    {
+        "Organize academic papers with intelligent metadata",
+        "INPUT can be:",
+        "URL",
+        "PDF file",
+        "Directory",
+        "--dir",
+        "--name",
+        "--quiet",
+        "--verbose",
+    }
+)
+HELP_FRAGMENT_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(HELP_FRAGMENTS, key=len, reverse=True)))
+)
 
-def test_cli_help() -> None:
-    """Test CLI help output contains expected content."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
+# Root for paths that tests only compute and never touch on disk
+FAKE_ROOT = Path("/fake")
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Share one CliRunner across the module; it holds no per-test state."""
+    return CliRunner()
+
+
+@pytest.fixture
+def fake_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point Path.home() at tmp_path and clear PAPERS_DIR for the test."""
+    monkeypatch.setattr("paperorganize.cli.Path.home", lambda: tmp_path)
+    monkeypatch.delenv("PAPERS_DIR", raising=False)
+    return tmp_path
 
+
+@pytest.fixture(scope="module")
+def iso_fs(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Run the module's tests from one shared scratch directory.
+
+    Tests that write into it use unique filenames so they cannot collide.
+    """
+    directory = tmp_path_factory.mktemp("iso")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(directory)
+        yield directory
+
+
+@pytest.fixture(scope="session")
+def fake_pdf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of placeholder PDFs, written once and only read by tests."""
+    directory = tmp_path_factory.mktemp("pdfs")
+    (directory / "paper1.pdf").write_bytes(b"%PDF-1.4")
+    (directory / "paper2.pdf").write_bytes(b"%PDF-1.4")
+    return directory
+
+
+@pytest.fixture(scope="module")
+def help_output(runner: CliRunner) -> str:
+    """Render --help once for all help text assertions."""
+    result = runner.invoke(main, ["--help"])
     assert result.exit_code == 0
-    assert "Organize academic papers with intelligent metadata" in result.output
-    assert "INPUT can be:" in result.output
-    assert "URL" in result.output
-    assert "PDF file" in result.output
-    assert "Directory" in result.output
-    assert "--dir" in result.output
-    assert "--name" in result.output
-    assert "--quiet" in result.output
-    assert "--verbose" in result.output
-
-
-def test_cli_requires_input() -> None:
+    return result.output
+
+
+def test_cli_help(help_output: str) -> None:
+    """Test CLI help output contains expected content."""
+    found = set(HELP_FRAGMENT_PATTERN.findall(help_output))
+    assert found >= HELP_FRAGMENTS, f"missing from --help: {HELP_FRAGMENTS - found}"
+
+
+def test_cli_help_is_formatted_once(runner: CliRunner) -> None:
+    """Test repeated --help invocations reuse the cached help text."""
+    with patch("click.Command.format_help") as mock_format_help:
+        first = runner.invoke(main, ["--help"], prog_name="paper-organize-cache")
+        second = runner.invoke(main, ["--help"], prog_name="paper-organize-cache")
+
+    assert first.exit_code == second.exit_code == 0
+    mock_format_help.assert_called_once()
+
+
+def test_cli_requires_input(runner: CliRunner) -> None:
     """Test CLI fails gracefully when no input provided."""
-    runner = CliRunner()
     result = runner.invoke(main, [])
 
     assert result.exit_code != 0
     assert "Missing argument" in result.output or "Usage:" in result.output
 
 
+@patch("paperorganize.processors.get_download_info", return_value=(None, False))
 @patch("paperorganize.processors.download_file")
-def test_cli_with_url(mock_download: Any) -> None:
+def test_cli_with_url(
+    mock_download: Any,
+    mock_get_info: Any,
+    runner: CliRunner,
+    iso_fs: Path,
+    fake_home: Path,
+) -> None:
     """Test CLI accepts URL argument and processes successfully."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(
-            main, ["https://arxiv.org/pdf/2301.00001.pdf", "--quiet"]
-        )
+    result = runner.invoke(
+        main,
+        ["https://arxiv.org/pdf/2301.00001.pdf", "--quiet"],
+        catch_exceptions=False,
+    )
 
-        # Should succeed and call download
-        assert result.exit_code == 0
-        mock_download.assert_called_once()
+    # Should succeed and call download without touching the network
+    assert result.exit_code == 0
+    mock_download.assert_called_once()
+    mock_get_info.assert_called_once()
 
 
 # Directory Configuration Tests
 
 
-def test_determine_download_directory_command_line_flag() -> None:
+def test_determine_download_directory_command_line_flag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test --dir flag takes highest priority."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        custom_dir = str(Path(temp_dir) / "custom")
+    custom_dir = FAKE_ROOT / "custom"
 
-        # Should use command line flag even if PAPERS_DIR is set
-        with patch.dict(os.environ, {"PAPERS_DIR": "/some/other/path"}):
-            result = _determine_download_directory(custom_dir)
-            assert result == Path(custom_dir).expanduser()
+    # Should use command line flag even if PAPERS_DIR is set
+    monkeypatch.setenv("PAPERS_DIR", "/some/other/path")
+    result = _determine_download_directory(str(custom_dir))
+    assert result == custom_dir
 
 
-def test_determine_download_directory_papers_dir_env() -> None:
+def test_determine_download_directory_papers_dir_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test PAPERS_DIR environment variable is used when no --dir flag."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        papers_dir = str(Path(temp_dir) / "my_papers")
+    papers_dir = FAKE_ROOT / "my_papers"
 
-        with patch.dict(os.environ, {"PAPERS_DIR": papers_dir}):
-            result = _determine_download_directory(None)
-            assert result == Path(papers_dir).expanduser()
+    monkeypatch.setenv("PAPERS_DIR", str(papers_dir))
+    result = _determine_download_directory(None)
+    assert result == papers_dir
 
 
-def test_determine_download_directory_default_papers() -> None:
+def test_determine_download_directory_follows_papers_dir_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test cached resolution still picks up a changed PAPERS_DIR."""
+    monkeypatch.setenv("PAPERS_DIR", str(FAKE_ROOT / "first"))
+    assert _determine_download_directory(None) == FAKE_ROOT / "first"
+
+    monkeypatch.setenv("PAPERS_DIR", str(FAKE_ROOT / "second"))
+    assert _determine_download_directory(None) == FAKE_ROOT / "second"
+
+
+def test_determine_download_directory_default_papers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test ~/Papers default when no flag or env var."""
     # Clear PAPERS_DIR if it exists
-    with patch.dict(os.environ, {}, clear=True):
-        result = _determine_download_directory(None)
-        expected = Path.home() / "Papers"
-        assert result == expected
+    monkeypatch.delenv("PAPERS_DIR", raising=False)
+    result = _determine_download_directory(None)
+    expected = Path.home() / "Papers"
+    assert result == expected
 
 
-def test_determine_download_directory_returns_papers_path() -> None:
+def test_determine_download_directory_returns_papers_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test that _determine_download_directory returns ~/Papers path (no fallback logic)."""
-    with patch.dict(os.environ, {}, clear=True), patch(
-        "paperorganize.cli.Path.home"
-    ) as mock_home:
-        fake_home = Path("/fake/home")
-        mock_home.return_value = fake_home
+    fake_home = FAKE_ROOT / "home"
+    monkeypatch.setattr("paperorganize.cli.Path.home", lambda: fake_home)
+    monkeypatch.delenv("PAPERS_DIR", raising=False)
 
-        result = _determine_download_directory(None)
-        assert result == fake_home / "Papers"
+    result = _determine_download_directory(None)
+    assert result == fake_home / "Papers"
 
 
-def test_setup_download_directory_creates_directory() -> None:
+def test_setup_download_directory_creates_directory(tmp_path: Path) -> None:
     """Test that setup creates the target directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir) / "new_papers_dir"
-        assert not target_dir.exists()
+    target_dir = tmp_path / "new_papers_dir"
+    assert not target_dir.exists()
 
-        result_dir, is_first_run = _setup_download_directory(
-            str(target_dir), quiet=True
-        )
+    result_dir, is_first_run = _setup_download_directory(str(target_dir), quiet=True)
 
-        assert result_dir == target_dir
-        assert target_dir.exists()
-        assert not is_first_run  # Not first-run since we specified custom dir
+    assert result_dir == target_dir
+    assert target_dir.exists()
+    assert not is_first_run  # Not first-run since we specified custom dir
 
 
-def test_setup_download_directory_first_run_papers_dir() -> None:
+def test_setup_download_directory_first_run_papers_dir(fake_home: Path) -> None:
     """Test first-run experience with ~/Papers creation."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        fake_home = Path(temp_dir)
-        papers_dir = fake_home / "Papers"
+    papers_dir = fake_home / "Papers"
 
-        # Ensure Papers doesn't exist yet
-        assert not papers_dir.exists()
+    # Ensure Papers doesn't exist yet
+    assert not papers_dir.exists()
 
-        # Clear environment and mock home directory
-        with patch.dict(os.environ, {}, clear=True), patch(
-            "paperorganize.cli.Path.home", return_value=fake_home
-        ):
-            result_dir, is_first_run = _setup_download_directory(None, quiet=True)
+    result_dir, is_first_run = _setup_download_directory(None, quiet=True)
 
-            assert result_dir == papers_dir
-            assert papers_dir.exists()
-            assert is_first_run  # Should detect first-run
+    assert result_dir == papers_dir
+    assert papers_dir.exists()
+    assert is_first_run  # Should detect first-run
 
 
-def test_setup_download_directory_first_run_message() -> None:
-    """Test first-run message is shown when creating ~/Papers."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        fake_home = Path(temp_dir)
+def test_setup_download_directory_existing_papers_dir(fake_home: Path) -> None:
+    """Test an existing ~/Papers is reused and not treated as first run."""
+    papers_dir = fake_home / "Papers"
+    papers_dir.mkdir()
 
-        runner = CliRunner()
-        with patch("paperorganize.cli.Path.home", return_value=fake_home), patch.dict(
-            os.environ, {}, clear=True
-        ), runner.isolated_filesystem():
-            result_dir, is_first_run = _setup_download_directory(None, quiet=False)
-            assert is_first_run
+    result_dir, is_first_run = _setup_download_directory(None, quiet=True)
 
+    assert result_dir == papers_dir
+    assert not is_first_run
 
-def test_setup_download_directory_quiet_no_message() -> None:
-    """Test no first-run message when quiet=True."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        fake_home = Path(temp_dir)
-        papers_dir = fake_home / "Papers"
 
-        with patch("paperorganize.cli.Path.home", return_value=fake_home), patch.dict(
-            os.environ, {}, clear=True
-        ):
-            result_dir, is_first_run = _setup_download_directory(None, quiet=True)
-            assert result_dir == papers_dir
-            assert is_first_run  # Detected but no message shown
+def test_setup_download_directory_first_run_message(
+    fake_home: Path, iso_fs: Path
+) -> None:
+    """Test first-run message is shown when creating ~/Papers."""
+    result_dir, is_first_run = _setup_download_directory(None, quiet=False)
+    assert is_first_run
 
 
-def test_cli_help_shows_environment_variable() -> None:
-    """Test that help text mentions PAPERS_DIR and directory priority."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
+def test_setup_download_directory_quiet_no_message(fake_home: Path) -> None:
+    """Test no first-run message when quiet=True."""
+    result_dir, is_first_run = _setup_download_directory(None, quiet=True)
+    assert result_dir == fake_home / "Papers"
+    assert is_first_run  # Detected but no message shown
 
-    assert result.exit_code == 0
-    assert "PAPERS_DIR" in result.output
+
+def test_cli_help_shows_environment_variable(help_output: str) -> None:
+    """Test that help text mentions PAPERS_DIR and directory priority."""
+    assert "PAPERS_DIR" in help_output
 
 
-def test_cli_respects_papers_dir_env() -> None:
+def test_cli_respects_papers_dir_env(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test CLI integration with PAPERS_DIR environment variable."""
-    runner = CliRunner()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        papers_dir = str(Path(temp_dir) / "test_papers")
+    papers_dir = tmp_path / "test_papers"
+    monkeypatch.setenv("PAPERS_DIR", str(papers_dir))
 
-        with patch.dict(os.environ, {"PAPERS_DIR": papers_dir}), patch(
-            "paperorganize.processors.download_file"
-        ) as mock_download:
-            result = runner.invoke(main, ["https://example.com/test.pdf", "--quiet"])
+    with patch(
+        "paperorganize.processors.get_download_info", return_value=(None, False)
+    ), patch("paperorganize.processors.download_file") as mock_download:
+        result = runner.invoke(
+            main, ["https://example.com/test.pdf", "--quiet"], catch_exceptions=False
+        )
 
-            # Should succeed and use our custom directory
-            assert result.exit_code == 0
-            mock_download.assert_called_once()
+        # Should succeed and use our custom directory
+        assert result.exit_code == 0
+        mock_download.assert_called_once()
 
-            # Check that the download was called with path in our custom directory
-            call_args = mock_download.call_args[0]
-            download_path = Path(call_args[1])
-            assert str(download_path.parent) == papers_dir
+        # Check that the download was called with path in our custom directory
+        call_args = mock_download.call_args[0]
+        download_path = Path(call_args[1])
+        assert download_path.parent == papers_dir
 
 
-def test_setup_download_directory_fallback_to_cwd() -> None:
+def test_setup_download_directory_fallback_to_cwd(fake_home: Path) -> None:
     """Test fallback to current directory when ~/Papers creation fails."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        fake_home = Path(temp_dir)
-        papers_dir = fake_home / "Papers"
-        cwd = Path.cwd()
-
-        # Clear environment and mock home directory
-        with patch.dict(os.environ, {}, clear=True), patch(
-            "paperorganize.cli.Path.home", return_value=fake_home
-        ):
-            # Track which paths had mkdir called
-            mkdir_calls = []
-
-            def mock_mkdir(
-                self: Path, parents: bool = True, exist_ok: bool = True
-            ) -> None:
-                mkdir_calls.append(str(self))
-                if str(self) == str(papers_dir):
-                    error_msg = "Cannot create Papers directory"
-                    raise PermissionError(error_msg)
-                # For cwd, do nothing (it exists)
-
-            # Patch the mkdir method on Path instances
-            with patch("pathlib.Path.mkdir", mock_mkdir):
-                # Test the fallback
-                result_dir, is_first_run = _setup_download_directory(None, quiet=True)
-
-                # Should fallback to current working directory
-                assert result_dir == cwd
-                assert not is_first_run  # Not first-run when we fallback
-
-                # Verify mkdir was called for Papers and cwd
-                assert len(mkdir_calls) == 2
-                assert mkdir_calls[0] == str(papers_dir)
-                assert mkdir_calls[1] == str(cwd)
+    papers_dir = fake_home / "Papers"
+    cwd = Path.cwd()
+
+    # Only the ~/Papers creation fails; the existing cwd is left untouched
+    with patch(
+        "paperorganize.cli._create_directory",
+        side_effect=PermissionError("Cannot create Papers directory"),
+    ) as mock_create:
+        result_dir, is_first_run = _setup_download_directory(None, quiet=True)
+
+    # Should fallback to current working directory
+    assert result_dir == cwd
+    assert not is_first_run  # Not first-run when we fallback
+    mock_create.assert_called_once_with(papers_dir)
 
 
 def test_setup_download_directory_no_fallback_for_explicit_dir() -> None:
     """Test that explicit directories don't fallback to cwd on failure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        custom_dir = Path(temp_dir) / "custom" / "nested" / "dir"
+    custom_dir = FAKE_ROOT / "custom" / "nested" / "dir"
 
-        # Mock mkdir to always fail
-        def mock_mkdir(self: Path, parents: bool = True, exist_ok: bool = True) -> None:
-            error_msg = "Cannot create directory"
-            raise PermissionError(error_msg)
+    with patch(
+        "paperorganize.cli._create_directory",
+        side_effect=PermissionError("Cannot create directory"),
+    ), pytest.raises(FileSystemError) as exc_info:
+        # Should raise FileSystemError, not fallback
+        _setup_download_directory(str(custom_dir), quiet=True)
 
-        with patch("pathlib.Path.mkdir", mock_mkdir):
-            # Should raise FileSystemError, not fallback
-            with pytest.raises(FileSystemError) as exc_info:
-                _setup_download_directory(str(custom_dir), quiet=True)
-
-            assert "Cannot create directory" in str(exc_info.value)
-            assert "Set PAPERS_DIR or use --dir" in exc_info.value.details["suggestion"]
+    assert "Cannot create directory" in str(exc_info.value)
+    assert "Set PAPERS_DIR or use --dir" in exc_info.value.details["suggestion"]
 
 
 # New unified input tests
 
 
+@patch("paperorganize.processors.get_download_info", return_value=(None, False))
 @patch("paperorganize.processors.download_file")
-def test_cli_with_url_input(mock_download: Any) -> None:
+def test_cli_with_url_input(
+    mock_download: Any,
+    mock_get_info: Any,
+    runner: CliRunner,
+    iso_fs: Path,
+    fake_home: Path,
+) -> None:
     """Test CLI with URL input."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(main, ["https://example.com/paper.pdf", "--quiet"])
+    result = runner.invoke(
+        main, ["https://example.com/paper.pdf", "--quiet"], catch_exceptions=False
+    )
 
-        assert result.exit_code == 0
-        mock_download.assert_called_once()
+    assert result.exit_code == 0
+    mock_download.assert_called_once()
 
 
-def test_cli_with_file_input() -> None:
+def test_cli_with_file_input(runner: CliRunner, fake_pdf_dir: Path) -> None:
     """Test CLI with existing PDF file input."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create a test PDF file
-        test_pdf = Path("test.pdf")
-        test_pdf.write_text("fake pdf content")
-
-        # Clear PAPERS_DIR and force directory to current (isolated) directory
-        with patch.dict(os.environ, {}, clear=False):
-            if "PAPERS_DIR" in os.environ:
-                del os.environ["PAPERS_DIR"]
-            result = runner.invoke(
-                main, [str(test_pdf), "--dir", ".", "--quiet", "--no-auto-name"]
-            )
-
-        assert result.exit_code == 0
+    # Organizing a file into its own directory without renaming writes nothing
+    test_pdf = fake_pdf_dir / "paper1.pdf"
+    result = runner.invoke(
+        main,
+        [str(test_pdf), "--dir", str(fake_pdf_dir), "--quiet", "--no-auto-name"],
+        catch_exceptions=False,
+    )
 
-
-def test_cli_with_directory_input() -> None:
+    assert result.exit_code == 0
+    assert sorted(p.name for p in fake_pdf_dir.iterdir()) == [
+        "paper1.pdf",
+        "paper2.pdf",
+    ]
+
+
+def test_cli_with_directory_input(
+    runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
+    iso_fs: Path,
+    fake_pdf_dir: Path,
+) -> None:
     """Test CLI with directory input."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create test directory with PDF files
-        test_dir = Path("test_papers")
-        test_dir.mkdir()
-
-        pdf1 = test_dir / "paper1.pdf"
-        pdf2 = test_dir / "paper2.pdf"
-        pdf1.write_text("fake pdf 1")
-        pdf2.write_text("fake pdf 2")
-
-        # Clear PAPERS_DIR and force directory to current (isolated) directory
-        with patch.dict(os.environ, {}, clear=False):
-            if "PAPERS_DIR" in os.environ:
-                del os.environ["PAPERS_DIR"]
-            result = runner.invoke(
-                main, [str(test_dir), "--dir", ".", "--quiet", "--no-auto-name"]
-            )
+    # Clear PAPERS_DIR and force directory to current (isolated) directory
+    monkeypatch.delenv("PAPERS_DIR", raising=False)
+    result = runner.invoke(
+        main,
+        [str(fake_pdf_dir), "--dir", ".", "--quiet", "--no-auto-name"],
+        catch_exceptions=False,
+    )
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
 
 
-def test_cli_invalid_input() -> None:
+def test_cli_invalid_input(runner: CliRunner) -> None:
     """Test CLI with invalid input."""
-    runner = CliRunner()
-
     result = runner.invoke(main, ["/nonexistent/path"])
 
     assert result.exit_code != 0
     assert "Invalid input" in result.output
 
 
-def test_cli_non_pdf_file() -> None:
+def test_cli_non_pdf_file(runner: CliRunner, iso_fs: Path) -> None:
     """Test CLI rejects non-PDF files."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create a non-PDF file
-        test_file = Path("test.txt")
-        test_file.write_text("not a pdf")
+    # Create a non-PDF file
+    test_file = Path(f"test-{uuid4()}.txt")
+    test_file.write_text("not a pdf")
 
-        result = runner.invoke(main, [str(test_file)])
+    result = runner.invoke(main, [str(test_file)])
 
-        assert result.exit_code != 0
-        assert "File must be a PDF" in result.output
+    assert result.exit_code != 0
+    assert "File must be a PDF" in result.output
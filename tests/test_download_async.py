@@ -0,0 +1,238 @@
+# ABOUTME: Tests for the optional aiohttp event-loop download backend
+# ABOUTME: Runs coroutines with asyncio.run against the local test HTTP server
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import contextlib
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+from unittest.mock import patch
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from paperorganize import download_async
+from paperorganize.download import MAX_RETRY_DELAY
+from paperorganize.download_async import (
+    WRITE_BUFFER_SIZE,
+    create_session,
+    download_file_async,
+    download_files_async,
+    download_files_blocking,
+)
+from paperorganize.exceptions import HTTPError, NetworkError
+
+from .http_test_helpers import setup_error_response, setup_pdf_response
+
+aiohttp = pytest.importorskip("aiohttp")
+
+HTTP_NOT_FOUND = 404
+
+
+def test_download_file_async_success(
+    http_server: HTTPServer, pdf_fixture_minimal: bytes, tmp_path: Path
+) -> None:
+    """Test successful file download on the event loop."""
+    url = setup_pdf_response(http_server, "/async.pdf", pdf_fixture_minimal)
+    dest_path = tmp_path / "test.pdf"
+    progress_calls: list[tuple[int, int]] = []
+
+    async def run() -> None:
+        async with create_session() as session:
+            await download_file_async(
+                session,
+                url,
+                str(dest_path),
+                lambda done, total: progress_calls.append((done, total)),
+            )
+
+    asyncio.run(run())
+
+    assert dest_path.read_bytes() == pdf_fixture_minimal
+    size = len(pdf_fixture_minimal)
+    assert progress_calls[-1] == (size, size)
+
+
+def test_download_all_reports_each_url(
+    http_server: HTTPServer, pdf_fixture_minimal: bytes, tmp_path: Path
+) -> None:
+    """Test download_files_async returns per-URL results in input order."""
+    urls = [
+        setup_pdf_response(http_server, f"/batch{i}.pdf", pdf_fixture_minimal)
+        for i in range(5)
+    ]
+    missing = setup_error_response(http_server, "/missing.pdf", HTTP_NOT_FOUND)
+    pairs = [
+        (url, str(tmp_path / f"{i}.pdf")) for i, url in enumerate([*urls, missing])
+    ]
+
+    results = asyncio.run(download_files_async(pairs, max_concurrent=2))
+
+    assert [url for url, _ in results] == [*urls, missing]
+    assert all(error is None for _, error in results[:-1])
+    error = results[-1][1]
+    assert isinstance(error, HTTPError)
+    assert error.status_code == HTTP_NOT_FOUND
+    assert not (tmp_path / "5.pdf").exists()
+
+
+def test_download_files_blocking_facade(
+    http_server: HTTPServer, pdf_fixture_minimal: bytes, tmp_path: Path
+) -> None:
+    """Test the synchronous facade runs the batch on its own event loop."""
+    url = setup_pdf_response(http_server, "/facade.pdf", pdf_fixture_minimal)
+    dest_path = tmp_path / "facade.pdf"
+
+    assert download_files_blocking([(url, str(dest_path))]) == [(url, None)]
+    assert dest_path.read_bytes() == pdf_fixture_minimal
+
+
+def test_download_file_async_progress_is_cumulative(
+    http_server: HTTPServer, large_pdf_content: bytes, tmp_path: Path
+) -> None:
+    """Test progress sums variable-size wire chunks up to the full size."""
+    url = setup_pdf_response(http_server, "/large-async.pdf", large_pdf_content)
+    dest_path = tmp_path / "large.pdf"
+    progress_calls: list[tuple[int, int]] = []
+
+    async def run() -> None:
+        async with create_session() as session:
+            await download_file_async(
+                session,
+                url,
+                str(dest_path),
+                lambda done, total: progress_calls.append((done, total)),
+            )
+
+    asyncio.run(run())
+
+    done_values = [done for done, _ in progress_calls]
+    assert done_values == sorted(done_values)
+    assert progress_calls[-1] == (len(large_pdf_content), len(large_pdf_content))
+    assert dest_path.read_bytes() == large_pdf_content
+
+
+def test_download_file_async_coalesces_disk_writes(
+    http_server: HTTPServer, tmp_path: Path
+) -> None:
+    """Test small network reads are joined into WRITE_BUFFER_SIZE writes."""
+    payload = b"%PDF-1.4 " + b"x" * (3 * WRITE_BUFFER_SIZE)
+    url = setup_pdf_response(http_server, "/coalesced.pdf", payload)
+    dest_path = tmp_path / "coalesced.pdf"
+
+    async def run() -> None:
+        async with create_session() as session:
+            await download_file_async(session, url, str(dest_path))
+
+    with patch.object(
+        download_async, "_write_all", wraps=download_async._write_all
+    ) as write_all:
+        asyncio.run(run())
+
+    assert write_all.call_count <= -(-len(payload) // WRITE_BUFFER_SIZE)
+    assert dest_path.read_bytes() == payload
+
+
+def test_with_retry_async_backs_off_between_attempts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test failed connects are retried with the shared backoff policy."""
+    sleeps: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(download_async.asyncio, "sleep", record_sleep)
+    outcomes = iter([aiohttp.ClientConnectionError("refused")] * 2)
+
+    async def flaky() -> str:
+        error = next(outcomes, None)
+        if error is not None:
+            raise error
+        return "ok"
+
+    result = asyncio.run(
+        download_async._with_retry_async(
+            flaky,
+            max_retries=3,
+            retryable_exceptions=(aiohttp.ClientConnectionError,),
+        )
+    )
+
+    assert result == "ok"
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= MAX_RETRY_DELAY for delay in sleeps)
+
+
+def test_download_file_async_times_out_stalled_body(
+    http_server: HTTPServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a server that stops sending mid-body fails instead of hanging."""
+    monkeypatch.setattr(download_async, "REQUEST_TIMEOUT", 0.2)
+
+    def stalled(_request: Request) -> Response:
+        def body() -> Iterator[bytes]:
+            yield b"%PDF-1.4 "
+            time.sleep(1)
+            yield b"too late"
+
+        return Response(body(), headers={"Content-Length": "17"})
+
+    http_server.expect_request("/stalled.pdf").respond_with_handler(stalled)
+    dest_path = tmp_path / "stalled.pdf"
+
+    async def run() -> None:
+        async with create_session() as session:
+            await download_file_async(
+                session, http_server.url_for("/stalled.pdf"), str(dest_path)
+            )
+
+    with pytest.raises(NetworkError):
+        asyncio.run(run())
+
+    assert not dest_path.exists()
+
+
+def test_download_file_async_cancel_waits_for_inflight_write(
+    http_server: HTTPServer, tmp_path: Path
+) -> None:
+    """Test cancelling mid-flush leaves the file open until the write ends."""
+    payload = b"%PDF-1.4 " + b"x" * WRITE_BUFFER_SIZE
+    url = setup_pdf_response(http_server, "/cancelled.pdf", payload)
+    dest_path = tmp_path / "cancelled.pdf"
+    write_all = download_async._write_all
+    started, release = threading.Event(), threading.Event()
+    outcomes: list[Optional[OSError]] = []
+
+    def held_write(fd: int, data: bytes) -> None:
+        started.set()
+        release.wait(5)
+        try:
+            write_all(fd, data)
+        except OSError as e:
+            outcomes.append(e)
+        else:
+            outcomes.append(None)
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        async with create_session() as session:
+            task = asyncio.ensure_future(
+                download_file_async(session, url, str(dest_path))
+            )
+            await loop.run_in_executor(None, started.wait, 5)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            release.set()
+            while not outcomes:
+                await asyncio.sleep(0.01)
+
+    with patch.object(download_async, "_write_all", held_write):
+        asyncio.run(run())
+
+    assert outcomes == [None]
+    assert not dest_path.exists()
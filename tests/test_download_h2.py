@@ -0,0 +1,97 @@
+# ABOUTME: Tests for the optional httpx HTTP/2 batch download backend
+# ABOUTME: Uses httpx.MockTransport so no network access is needed
+# SPDX-License-Identifier: MIT
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import pytest
+
+from paperorganize.download import partial_download_path
+from paperorganize.download_h2 import create_client, download_file_h2
+from paperorganize.exceptions import HTTPError, NetworkError, ValidationError
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    httpx = pytest.importorskip("httpx")
+
+HTTP_NOT_FOUND = 404
+
+
+def _client_for(
+    handler: "Callable[[httpx.Request], httpx.Response]",
+) -> "httpx.Client":
+    return create_client(transport=httpx.MockTransport(handler))
+
+
+def test_download_file_h2_success(tmp_path: Path) -> None:
+    """Test successful file download over the HTTP/2 client."""
+    dest_path = tmp_path / "test.pdf"
+    progress_calls: list[tuple[int, int]] = []
+    encodings: list[str] = []
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        encodings.append(request.headers["accept-encoding"])
+        return httpx.Response(200, content=b"test data")
+
+    with _client_for(handler) as client:
+        download_file_h2(
+            client,
+            "https://example.com/test.pdf",
+            str(dest_path),
+            lambda done, total: progress_calls.append((done, total)),
+        )
+
+    assert dest_path.read_bytes() == b"test data"
+    assert progress_calls == [(9, 9)]
+    assert encodings == ["identity"]
+
+
+def test_download_file_h2_http_error(tmp_path: Path) -> None:
+    """Test HTTP error statuses map to HTTPError without a file left behind."""
+    dest_path = tmp_path / "test.pdf"
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        return httpx.Response(HTTP_NOT_FOUND)
+
+    with _client_for(handler) as client, pytest.raises(HTTPError) as exc_info:
+        download_file_h2(client, "https://example.com/missing.pdf", str(dest_path))
+
+    assert exc_info.value.status_code == HTTP_NOT_FOUND
+    assert not dest_path.exists()
+
+
+def test_download_file_h2_incomplete(tmp_path: Path) -> None:
+    """Test a body shorter than Content-Length is rejected and removed."""
+    dest_path = tmp_path / "test.pdf"
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        return httpx.Response(
+            200, headers={"content-length": "100"}, content=b"partial"
+        )
+
+    with _client_for(handler) as client, pytest.raises(ValidationError):
+        download_file_h2(client, "https://example.com/test.pdf", str(dest_path))
+
+    assert not dest_path.exists()
+
+
+def test_download_file_h2_read_error_mid_body(tmp_path: Path) -> None:
+    """Test a connection dropped mid-body maps to NetworkError and cleans up."""
+    dest_path = tmp_path / "test.pdf"
+
+    class _DroppedStream(httpx.SyncByteStream):
+        def __iter__(self) -> Iterator[bytes]:
+            yield b"partial"
+            msg = "connection reset"
+            raise httpx.ReadError(msg)
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        return httpx.Response(200, stream=_DroppedStream())
+
+    with _client_for(handler) as client, pytest.raises(NetworkError):
+        download_file_h2(client, "https://example.com/test.pdf", str(dest_path))
+
+    assert not dest_path.exists()
+    assert not partial_download_path(dest_path).exists()
@@ -8,6 +8,7 @@ from paperorganize.exceptions import ValidationError
 from paperorganize.input_detection import (
     InputType,
     detect_input_type,
+    iter_directory_pdfs,
     normalize_url,
     validate_directory_contains_pdfs,
 )
@@ -186,3 +187,36 @@ class TestValidateDirectoryContainsPdfs:
         assert pdf1 in result
         assert pdf2 in result
         assert txt1 not in result
+
+    def test_iter_directory_pdfs_is_lazy(self, tmp_path: Path) -> None:
+        """Test PDFs are yielded before the whole directory is scanned."""
+        (tmp_path / "paper.pdf").write_text("fake pdf")
+
+        pdf_iter = iter_directory_pdfs(tmp_path)
+
+        assert next(pdf_iter) == tmp_path / "paper.pdf"
+
+    def test_iter_directory_pdfs_matches_extension_case_insensitively(
+        self, tmp_path: Path
+    ) -> None:
+        """Test upper-case .PDF files are found, matching detect_input_type."""
+        (tmp_path / "PAPER.PDF").write_text("fake pdf")
+        (tmp_path / "notes.txt").write_text("not a pdf")
+        (tmp_path / "folder.pdf").mkdir()
+
+        assert list(iter_directory_pdfs(tmp_path)) == [tmp_path / "PAPER.PDF"]
+
+    def test_iter_directory_pdfs_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test symlinked PDFs are not followed."""
+        target = tmp_path / "real.pdf"
+        target.write_text("fake pdf")
+        (tmp_path / "link.pdf").symlink_to(target)
+
+        assert list(iter_directory_pdfs(tmp_path)) == [target]
+
+    def test_iter_directory_pdfs_raises_when_empty(self, tmp_path: Path) -> None:
+        """Test the scan raises once it finishes without finding a PDF."""
+        with pytest.raises(ValidationError) as exc_info:
+            list(iter_directory_pdfs(tmp_path))
+
+        assert "No PDF files found" in str(exc_info.value)
@@ -5,6 +5,8 @@
 import tempfile
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from paperorganize.metadata import (
     PaperMetadata,
     _extract_year_from_title,
@@ -52,6 +54,14 @@ class TestPaperMetadata:
         assert metadata.arxiv_id is None
         assert metadata.year is None
 
+    def test_paper_metadata_uses_slots(self) -> None:
+        """Test PaperMetadata instances carry no per-instance __dict__."""
+        metadata = PaperMetadata(title="Slotted Paper")
+
+        assert not hasattr(metadata, "__dict__")
+        with pytest.raises(AttributeError):
+            metadata.journal = "Not a field"  # type: ignore[attr-defined]
+
 
 class TestExtractPdfMetadata:
     """Test PDF metadata extraction functionality."""
@@ -106,6 +116,38 @@ class TestExtractPdfMetadata:
         assert result.arxiv_id is None
         assert result.year is None
 
+    @patch("paperorganize.metadata.EnhancedMetadataExtractor")
+    @patch("paperorganize.metadata.PdfReader")
+    def test_extract_opens_pdf_once_for_all_layers(
+        self, mock_pdf_reader: MagicMock, mock_extractor_class: MagicMock
+    ) -> None:
+        """Test the pypdf reader is shared with the enhanced pipeline."""
+        mock_reader = MagicMock()
+        mock_reader.metadata = {"/Title": "Shared Reader Paper"}
+        mock_pdf_reader.return_value = mock_reader
+
+        with patch("paperorganize.metadata.ENHANCED_EXTRACTION_AVAILABLE", True):
+            result = extract_pdf_metadata("paper.pdf")
+
+        mock_pdf_reader.assert_called_once_with("paper.pdf")
+        mock_extractor_class.return_value.extract_identifiers_and_enrich.assert_called_once_with(
+            "paper.pdf", result, reader=mock_reader
+        )
+
+    @patch("paperorganize.metadata.PdfReader")
+    def test_extract_parses_in_memory_content(self, mock_pdf_reader: MagicMock) -> None:
+        """Test in-memory content is parsed instead of reading the path."""
+        mock_reader = MagicMock()
+        mock_reader.metadata = {"/Title": "In Memory Paper"}
+        mock_pdf_reader.return_value = mock_reader
+
+        with patch("paperorganize.metadata.ENHANCED_EXTRACTION_AVAILABLE", False):
+            result = extract_pdf_metadata("paper.pdf", content=b"%PDF-1.4")
+
+        assert result.title == "In Memory Paper"
+        stream = mock_pdf_reader.call_args[0][0]
+        assert stream.getvalue() == b"%PDF-1.4"
+
 
 class TestGenerateFilename:
     """Test filename generation from metadata."""
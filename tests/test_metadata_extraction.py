@@ -4,6 +4,7 @@
 
 import tempfile
 import time
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 from paperorganize.metadata import PaperMetadata
@@ -20,6 +21,7 @@ from paperorganize.metadata_extraction.pattern_matchers import (
 from paperorganize.metadata_extraction.text_extractors import (
     PdfPlumberExtractor,
     PyPDFExtractor,
+    _import_pdfplumber,
 )
 
 
@@ -70,6 +72,42 @@ class TestPdfPlumberExtractor:
         # Should have called extract_text only once due to early exit
         mock_page.extract_text.assert_called_once()
 
+    @patch("paperorganize.metadata_extraction.text_extractors.time.monotonic")
+    @patch("pdfplumber.open")
+    def test_extract_text_stops_when_time_budget_exceeded(
+        self, mock_pdfplumber_open: MagicMock, mock_monotonic: MagicMock
+    ) -> None:
+        """Test later pages are skipped once the time budget is spent."""
+        extractor = PdfPlumberExtractor()
+
+        mock_pdf = MagicMock()
+        slow_page = MagicMock()
+        slow_page.extract_text.return_value = "Slow first page"
+        skipped_page = MagicMock()
+        mock_pdf.pages = [slow_page, skipped_page]
+        mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+        # Start of extraction, then a check after the first page is past budget
+        mock_monotonic.side_effect = [0.0, 60.0]
+
+        result = extractor.extract_text("paper.pdf")
+
+        assert result == "Slow first page"
+        skipped_page.extract_text.assert_not_called()
+
+    @patch("pdfplumber.open")
+    def test_pdfplumber_module_imported_once(
+        self, mock_pdfplumber_open: MagicMock
+    ) -> None:
+        """Test repeated extractions reuse the cached pdfplumber module."""
+        extractor = PdfPlumberExtractor()
+        mock_pdfplumber_open.return_value.__enter__.return_value.pages = []
+
+        extractor.extract_text("first.pdf")
+        hits_before = _import_pdfplumber.cache_info().hits
+        extractor.extract_text("second.pdf")
+
+        assert _import_pdfplumber.cache_info().hits == hits_before + 1
+
 
 class TestPyPDFExtractor:
     """Test pypdf-based text extraction."""
@@ -485,6 +523,23 @@ class TestEnhancedMetadataExtractor:
 
             assert result == ""
 
+    def test_extract_text_with_fallback_reuses_open_reader(self) -> None:
+        """Test that an already-open pypdf reader is used instead of re-parsing."""
+        extractor = EnhancedMetadataExtractor()
+
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = "Text from shared reader"
+        mock_reader = MagicMock()
+        mock_reader.pages = [mock_page]
+
+        with patch.object(extractor.text_extractors[0], "extract_text") as mock_open:
+            result = extractor._extract_text_with_fallback(
+                "unused.pdf", reader=mock_reader
+            )
+
+        assert result == "Text from shared reader"
+        mock_open.assert_not_called()
+
     def test_process_doi_matches_sets_doi(self) -> None:
         """Test DOI processing sets metadata.doi."""
         extractor = EnhancedMetadataExtractor()
@@ -628,7 +683,9 @@ def test_integration_extract_pdf_metadata_with_enhanced_pipeline() -> None:
                 mock_extractor_class.return_value = mock_extractor
 
                 # Mock extract_identifiers_and_enrich to simulate finding DOI and enriching
-                def mock_enrich(pdf_path: str, metadata: PaperMetadata) -> None:
+                def mock_enrich(
+                    pdf_path: str, metadata: PaperMetadata, reader: Any = None
+                ) -> None:
                     # Simulate finding DOI and enriching from CrossRef
                     metadata.doi = "10.1234/example.doi"
                     metadata.title = "Example Paper Title from CrossRef"
@@ -645,7 +702,7 @@ def test_integration_extract_pdf_metadata_with_enhanced_pipeline() -> None:
                     # Verify enhanced extractor was called
                     mock_extractor_class.assert_called_once()
                     mock_extractor.extract_identifiers_and_enrich.assert_called_once_with(
-                        tmp_path, result
+                        tmp_path, result, reader=None
                     )
 
                     # Verify metadata was enriched by enhanced pipeline
@@ -692,7 +749,9 @@ def test_integration_enhanced_pipeline_preserves_pypdf_data() -> None:
                         mock_extractor_class.return_value = mock_extractor
 
                         # Mock enhanced extractor to only add DOI (preserving pypdf data)
-                        def mock_enrich(pdf_path: str, metadata: PaperMetadata) -> None:
+                        def mock_enrich(
+                            pdf_path: str, metadata: PaperMetadata, reader: Any = None
+                        ) -> None:
                             # Only add DOI, preserve existing title/authors from pypdf
                             metadata.doi = "10.1234/found.doi"
                             # Don't overwrite existing title/authors
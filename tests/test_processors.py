@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
+from paperorganize.models import PaperMetadata
 from paperorganize.processors import (
     DirectoryProcessor,
     FileProcessor,
@@ -128,6 +129,25 @@ class TestURLProcessor:
             )
             assert filename == "1901.06032.pdf"  # Fallback to URL parsing
 
+    @patch("paperorganize.processors.get_download_info")
+    def test_url_processor_filename_ignores_host_query_and_fragment(
+        self, mock_get_info: Any
+    ) -> None:
+        """Test that only the last path segment of the URL is used as filename."""
+        mock_get_info.return_value = (None, False)
+        processor = URLProcessor()
+
+        cases = {
+            "https://example.com": "paper.pdf",
+            "https://example.com/": "paper.pdf",
+            "https://example.com/?file=x.pdf": "paper.pdf",
+            "https://example.com/papers/report/": "report.pdf",
+            "https://example.com/a/b/doc.pdf?token=1#page=2": "doc.pdf",
+            "http://host:8080/dl#frag": "dl.pdf",
+        }
+        for url, expected in cases.items():
+            assert processor._determine_filename(None, url) == expected, url
+
     @patch("paperorganize.processors.download_file")
     def test_url_processor_normalizes_arxiv_abstract_url(
         self, mock_download: Any, tmp_path: Path
@@ -149,6 +169,38 @@ class TestURLProcessor:
         actual_url = mock_download.call_args[0][0]
         assert actual_url == "https://arxiv.org/pdf/2504.21798"
 
+    @patch("paperorganize.processors.apply_metadata_naming")
+    @patch("paperorganize.processors.extract_pdf_metadata")
+    @patch("paperorganize.processors.download_file")
+    def test_url_processor_extracts_from_downloaded_bytes(
+        self,
+        mock_download: Any,
+        mock_extract: Any,
+        mock_naming: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test metadata is parsed from the in-memory download, not re-read from disk."""
+
+        def fake_download(*_args: Any, **kwargs: Any) -> None:
+            kwargs["content_buffer"].write(b"%PDF-1.4 downloaded bytes")
+
+        mock_download.side_effect = fake_download
+        mock_extract.return_value = PaperMetadata()
+        mock_naming.return_value = tmp_path / "paper.pdf"
+
+        processor = URLProcessor()
+        processor.process(
+            "https://example.com/paper.pdf",
+            tmp_path,
+            None,
+            auto_name=True,
+            quiet=True,
+        )
+
+        mock_extract.assert_called_once_with(
+            str(tmp_path / "paper.pdf"), content=b"%PDF-1.4 downloaded bytes"
+        )
+
 
 class TestFileProcessor:
     """Test file processing functionality."""
@@ -233,7 +285,7 @@ class TestFileProcessor:
 class TestDirectoryProcessor:
     """Test directory processing functionality."""
 
-    @patch("paperorganize.processors.validate_directory_contains_pdfs")
+    @patch("paperorganize.processors.iter_directory_pdfs")
     def test_directory_processor_multiple_files(
         self, mock_validate: Any, tmp_path: Path
     ) -> None:
@@ -268,7 +320,7 @@ class TestDirectoryProcessor:
         # Should have called file processor for each PDF
         assert mock_file_process.call_count == 2
 
-    @patch("paperorganize.processors.validate_directory_contains_pdfs")
+    @patch("paperorganize.processors.iter_directory_pdfs")
     def test_directory_processor_ignores_custom_name(
         self, mock_validate: Any, tmp_path: Path
     ) -> None:
@@ -298,3 +350,74 @@ class TestDirectoryProcessor:
             mock_file_process.assert_called_once()
             call_args = mock_file_process.call_args
             assert call_args[1]["custom_name"] is None
+
+    @patch("paperorganize.processors.iter_directory_pdfs")
+    def test_directory_processor_in_place_runs_in_sorted_order(
+        self, mock_iter: Any, tmp_path: Path
+    ) -> None:
+        """Test in-place batches ignore directory order, so suffixes are stable."""
+        names = ["c.pdf", "a.pdf", "b.pdf"]
+        mock_iter.return_value = iter([tmp_path / name for name in names])
+
+        with patch.object(FileProcessor, "process", return_value=[]) as mock_process:
+            DirectoryProcessor().process(
+                str(tmp_path), tmp_path, None, auto_name=True, quiet=True
+            )
+
+        processed = [Path(call.args[0]).name for call in mock_process.call_args_list]
+        assert processed == sorted(names)
+
+    def test_directory_processor_resolves_conflicts_across_batch(
+        self, tmp_path: Path
+    ) -> None:
+        """Test batch conflicts resolve against names already in the destination."""
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
+        dest_dir.mkdir()
+        (source_dir / "paper.pdf").write_text("new paper")
+        (dest_dir / "paper.pdf").write_text("existing paper")
+        (dest_dir / "paper_1.pdf").write_text("existing paper 1")
+
+        processor = DirectoryProcessor()
+        results = processor.process(
+            str(source_dir),
+            dest_dir,
+            None,
+            auto_name=False,
+            quiet=True,
+        )
+
+        assert results[0].final_path == dest_dir / "paper_2.pdf"
+        assert (dest_dir / "paper_2.pdf").read_text() == "new paper"
+        assert (dest_dir / "paper.pdf").read_text() == "existing paper"
+
+    def test_directory_processor_in_place_processes_each_file_once(
+        self, tmp_path: Path
+    ) -> None:
+        """Test renamed files are not rediscovered when organizing in place."""
+        (tmp_path / "a.pdf").write_text("fake pdf a")
+        (tmp_path / "b.pdf").write_text("fake pdf b")
+
+        def rename(file_path: Path, **kwargs: Any) -> Path:
+            new_path = file_path.with_name(f"Renamed_{file_path.name}")
+            file_path.rename(new_path)
+            return new_path
+
+        processor = DirectoryProcessor()
+        with patch(
+            "paperorganize.processors.apply_metadata_naming", side_effect=rename
+        ):
+            results = processor.process(
+                str(tmp_path),
+                tmp_path,
+                None,
+                auto_name=True,
+                quiet=True,
+            )
+
+        assert len(results) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "Renamed_a.pdf",
+            "Renamed_b.pdf",
+        ]
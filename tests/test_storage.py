@@ -4,10 +4,13 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-import pytest
-
-from paperorganize.storage import ensure_directory, resolve_conflicts
+from paperorganize.storage import (
+    ensure_directory,
+    resolve_conflicts,
+    resolve_name_conflict,
+)
 
 
 def test_ensure_directory_creates_path() -> None:
@@ -35,12 +38,41 @@ def test_ensure_directory_handles_existing() -> None:
         assert test_path.is_dir()
 
 
-def test_resolve_conflicts_not_implemented() -> None:
-    """Test resolve_conflicts raises NotImplementedError until implemented."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_file = Path(tmpdir) / "test.pdf"
-        test_file.touch()  # Create existing file
+def test_resolve_conflicts_returns_free_path(tmp_path: Path) -> None:
+    """Test resolve_conflicts keeps free paths and numbers taken ones."""
+    test_file = tmp_path / "test.pdf"
+    assert resolve_conflicts(str(test_file)) == str(test_file)
+
+    test_file.touch()  # Create existing file
+
+    assert resolve_conflicts(str(test_file)) == str(tmp_path / "test_1.pdf")
+
+
+def test_resolve_name_conflict_appends_counter(tmp_path: Path) -> None:
+    """Test resolve_name_conflict skips names already on disk."""
+    (tmp_path / "paper.pdf").touch()
+    (tmp_path / "paper_1.pdf").touch()
+
+    assert resolve_name_conflict(tmp_path, "paper.pdf") == tmp_path / "paper_2.pdf"
+
+
+def test_resolve_name_conflict_uses_snapshot_without_stat(tmp_path: Path) -> None:
+    """Test resolve_name_conflict checks the snapshot instead of the filesystem."""
+    existing = {"paper.pdf", "paper_1.pdf"}
+
+    with patch.object(Path, "exists") as mock_exists:
+        result = resolve_name_conflict(tmp_path, "paper.pdf", existing)
+
+    mock_exists.assert_not_called()
+    assert result == tmp_path / "paper_2.pdf"
+    # The chosen name is reserved for subsequent calls
+    assert "paper_2.pdf" in existing
+
+
+def test_resolve_name_conflict_ignores_own_name(tmp_path: Path) -> None:
+    """Test a file never conflicts with itself."""
+    (tmp_path / "paper.pdf").touch()
+
+    result = resolve_name_conflict(tmp_path, "paper.pdf", own_name="paper.pdf")
 
-        # Should raise NotImplementedError for now
-        with pytest.raises(NotImplementedError):
-            resolve_conflicts(str(test_file))
+    assert result == tmp_path / "paper.pdf"